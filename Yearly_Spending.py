@@ -18,7 +18,8 @@ BUDGET_CATEGORIES = [
     "Pest control", "Landscaping", "Games", "Vacation", "Personal"
 ]
 
-MAPPINGS_FILE = BASE_DIR / "category_mappings.csv"
+MAPPINGS_FILE = BASE_DIR / "category_mappings.parquet"
+LEGACY_MAPPINGS_CSV = BASE_DIR / "category_mappings.csv"  # migrated on first load
 
 # Bank category fallback — maps bank's original category to a reasonable budget default
 BANK_CATEGORY_FALLBACK = {
@@ -105,7 +106,31 @@ _SEED_CATEGORY_MAP = {
     ('Trader Joes', 'Groceries'): 'Groceries'
 }
 
+def write_combined_export(df, filename):
+    """Write a combined export as CSV, plus a Parquet twin when pyarrow is available.
+
+    The dashboard prefers the Parquet file: columnar, typed, and compressed,
+    so it loads without CSV parsing or dtype inference.
+    """
+    df.to_csv(DATA_DIR / filename, index=False)
+    try:
+        df.to_parquet(DATA_DIR / (Path(filename).stem + '.parquet'), index=False)
+    except (ImportError, ValueError):
+        pass
+
+
 def load_category_mappings():
+    # Mappings live in Parquet (typed, no CSV parse on every load). A
+    # pre-Parquet checkout still has the CSV, so migrate it once.
+    if not MAPPINGS_FILE.exists() and LEGACY_MAPPINGS_CSV.exists():
+        try:
+            legacy_df = pd.read_csv(LEGACY_MAPPINGS_CSV)
+        except pd.errors.EmptyDataError:
+            legacy_df = pd.DataFrame(
+                columns=['Clean_Description', 'Bank_Category', 'Budget_Category'])
+        legacy_df.to_parquet(MAPPINGS_FILE, index=False)
+        print(f"Migrated {LEGACY_MAPPINGS_CSV.name} to {MAPPINGS_FILE.name}.")
+
     if not MAPPINGS_FILE.exists():
         rows = [
             {'Clean_Description': desc, 'Bank_Category': bank_cat, 'Budget_Category': budget_cat}
@@ -114,14 +139,11 @@ def load_category_mappings():
         seed_df = pd.DataFrame(rows).drop_duplicates(
             subset=['Clean_Description', 'Bank_Category'], keep='last'
         )
-        seed_df.to_csv(MAPPINGS_FILE, index=False)
+        seed_df.to_parquet(MAPPINGS_FILE, index=False)
         print(f"Created {MAPPINGS_FILE.name} with {len(seed_df)} mappings from defaults.")
 
-    try:
-        mappings_df = pd.read_csv(MAPPINGS_FILE)
-        if mappings_df.empty:
-            return {}
-    except pd.errors.EmptyDataError:
+    mappings_df = pd.read_parquet(MAPPINGS_FILE)
+    if mappings_df.empty:
         return {}
 
     return dict(zip(
@@ -411,7 +433,7 @@ def export_yearly_and_combined(data_list, years, output_cols, per_year_suffix, c
 
     if all_yearly:
         combined = pd.concat(all_yearly, ignore_index=True).drop_duplicates()
-        combined.to_csv(DATA_DIR / combined_filename, index=False)
+        write_combined_export(combined, combined_filename)
         print(f"\nCombined: {len(combined)} total transactions in {combined_filename}")
 
     return all_yearly
@@ -516,12 +538,12 @@ def main():
 
         if all_yearly_spending:
             combined_spending = pd.concat(all_yearly_spending, ignore_index=True).drop_duplicates()
-            combined_spending.to_csv(DATA_DIR / "all_transactions.csv", index=False)
+            write_combined_export(combined_spending, "all_transactions.csv")
             print(f"\nCombined: {len(combined_spending)} total credit card transactions across {len(cc_years)} year(s)")
 
         if all_yearly_payments:
             combined_payments = pd.concat(all_yearly_payments, ignore_index=True).drop_duplicates()
-            combined_payments.to_csv(DATA_DIR / "all_credit_card_payments.csv", index=False)
+            write_combined_export(combined_payments, "all_credit_card_payments.csv")
 
         all_spending = pd.concat(all_yearly_spending, ignore_index=True) if all_yearly_spending else pd.DataFrame()
         if not all_spending.empty:
@@ -586,7 +608,7 @@ def main():
 
             if all_yearly_income:
                 combined_income = pd.concat(all_yearly_income, ignore_index=True).drop_duplicates()
-                combined_income.to_csv(DATA_DIR / "all_income.csv", index=False)
+                write_combined_export(combined_income, "all_income.csv")
                 print(f"\nCombined: {len(combined_income)} total income transactions")
 
         # --- Checking expense processing ---
@@ -6,7 +6,8 @@ from pathlib import Path
 BASE_DIR = Path(__file__).resolve().parent
 DATA_DIR = BASE_DIR / "Data"
 CHECKING_DIR = DATA_DIR / "Checking"
-MAPPINGS_FILE = BASE_DIR / "category_mappings.csv"
+MAPPINGS_FILE = BASE_DIR / "category_mappings.parquet"
+LEGACY_MAPPINGS_CSV = BASE_DIR / "category_mappings.csv"  # migrated on first load
 NOTES_FILE = BASE_DIR / "transaction_notes.csv"
 
 # --- Budget Categories ---
@@ -1,8 +1,18 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
 from pathlib import Path
+import calendar
 import datetime
-from config import BUDGET_CATEGORIES, MONTH_NAMES, MAPPINGS_FILE, DATA_DIR, DEFAULT_TAGS
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+from config import (BUDGET_CATEGORIES, MONTH_NAMES, MAPPINGS_FILE,
+                    LEGACY_MAPPINGS_CSV, DATA_DIR, DEFAULT_TAGS)
 from recurring import detect_recurring_merchants, classify_transactions, detect_subscription_changes
 from transaction_notes import (
     add_tx_keys, load_notes, save_notes, merge_notes,
@@ -19,7 +29,10 @@ st.set_page_config(
 )
 
 # --- Modern "Fintech" UI Styling ---
-st.markdown("""
+# Emitted via st.html: raw passthrough, so the multi-KB block skips the
+# markdown parser on every rerun. (A session_state "inject once" guard
+# doesn't work here — Streamlit drops elements that aren't re-emitted.)
+_PAGE_CSS = """
     <style>
     html, body, [class*="css"] {
         font-family: 'Inter', 'Segoe UI', Roboto, sans-serif;
@@ -62,72 +75,263 @@ st.markdown("""
         border-bottom: 2px solid #3B82F6;
     }
     </style>
-""", unsafe_allow_html=True)
+"""
+st.html(_PAGE_CSS)
 
 # --- Helpers (kept here because they use @st.cache_data) ---
 
+# Hoisted month lookups so report generators don't rebuild them per call
+MONTH_NUM_BY_NAME3 = {v: k for k, v in MONTH_NAMES.items()}
+MONTH_COL_NAMES = [MONTH_NAMES[m] for m in range(1, 13)]
+MONTH_ORDER_FULL = list(calendar.month_name)[1:]  # 'January'..'December'
+MONTH_ABBR_BY_NUM = {m: calendar.month_abbr[m] for m in range(1, 13)}
+BUDGET_CATEGORIES_SORTED = sorted(BUDGET_CATEGORIES)
+
+MAPPING_COLS = ['Clean_Description', 'Bank_Category', 'Budget_Category']
+
+# Columns the dashboard actually reads from the combined exports; loading
+# only these keeps memory down and lets Parquet skip untouched columns
+TRANS_LOAD_COLS = ['Transaction Date', 'Clean_Description', 'Category',
+                   'Budget_Category', 'Net_Amount', 'Month']
+PAYMENT_LOAD_COLS = ['Transaction Date', 'Amount', 'Month']
+
+def _empty_mappings():
+    return pd.Series(dtype=object, index=pd.MultiIndex.from_arrays(
+        [[], []], names=['Clean_Description', 'Bank_Category']))
+
 @st.cache_data
 def load_mappings():
-    """Load category mappings from external CSV. Returns a dict."""
+    """Load category mappings from the external Parquet store.
+
+    Returns a Series of Budget_Category keyed on a
+    (Clean_Description, Bank_Category) MultiIndex — the exact shape
+    apply_mapping_overlay reindexes against, built without any Python
+    loop and memoized across reruns. Later rows win on duplicates.
+    """
     if not MAPPINGS_FILE.exists():
+        if not LEGACY_MAPPINGS_CSV.exists():
+            return _empty_mappings()
+        # One-time migration from the pre-Parquet CSV store
+        try:
+            pd.read_csv(LEGACY_MAPPINGS_CSV).to_parquet(MAPPINGS_FILE, index=False)
+        except pd.errors.EmptyDataError:
+            return _empty_mappings()
+    mappings_df = pd.read_parquet(MAPPINGS_FILE)
+    if mappings_df.empty:
+        return _empty_mappings()
+    mapping_series = pd.Series(
+        mappings_df['Budget_Category'].values,
+        index=pd.MultiIndex.from_arrays(
+            [mappings_df['Clean_Description'], mappings_df['Bank_Category']],
+            names=['Clean_Description', 'Bank_Category']))
+    return mapping_series[~mapping_series.index.duplicated(keep='last')]
+
+def _frame_fingerprint(df):
+    """Cheap cache key: row count plus the date span. Avoids hashing every
+    cell of the frame while still changing whenever new data lands."""
+    if 'Transaction Date' in df.columns and len(df):
+        dates = df['Transaction Date']
+        # The value checksum keeps two filter slices that happen to share
+        # a row count and date span from colliding
+        total = float(df['Net_Amount'].sum()) if 'Net_Amount' in df.columns else 0.0
+        return (len(df), str(dates.min()), str(dates.max()), total)
+    if df.empty:
+        return (0,)
+    # No date span to key on (e.g. recurring-merchant summaries); these
+    # frames are small enough that a full content hash stays cheap
+    return (len(df), int(pd.util.hash_pandas_object(df, index=False).sum()))
+
+@st.cache_resource(hash_funcs={pd.DataFrame: _frame_fingerprint})
+def split_by_year(df):
+    """Split a frame into per-year slices once, so picking a year is a
+    dict lookup instead of a full-column scan each rerun. cache_resource:
+    the slices are shared read-only views, same contract as load_data."""
+    if df.empty or 'Year' not in df.columns:
         return {}
-    try:
-        mappings_df = pd.read_csv(MAPPINGS_FILE)
-        if mappings_df.empty:
-            return {}
-    except pd.errors.EmptyDataError:
-        return {}
-    return dict(zip(
-        zip(mappings_df['Clean_Description'], mappings_df['Bank_Category']),
-        mappings_df['Budget_Category']
-    ))
+    return dict(tuple(df.groupby('Year', observed=True)))
 
-@st.cache_data
-def get_recurring_analysis(_df_dict):
+@st.cache_data(hash_funcs={pd.DataFrame: _frame_fingerprint})
+def get_recurring_analysis(df):
     """Cached recurring detection to avoid recomputing on every rerender."""
-    df = pd.DataFrame(_df_dict)
-    df['Transaction Date'] = pd.to_datetime(df['Transaction Date'])
     recurring_df = detect_recurring_merchants(df)
     alerts = detect_subscription_changes(df)
-    return recurring_df.to_dict('list'), alerts
-
-def apply_mapping_overlay(df, mappings_dict):
-    """Re-apply category mappings from CSV to override Budget_Category values."""
-    if not mappings_dict:
+    return recurring_df, alerts
+
+@st.cache_data(hash_funcs={pd.DataFrame: _frame_fingerprint})
+def classify_cached(df, recurring_merchants):
+    """Memoized classify_transactions: attaching is_recurring and
+    spending_type is a string isin over the whole year slice, so reruns
+    pull the classified frame from cache instead of recomputing."""
+    return classify_transactions(df, recurring_merchants)
+
+def apply_mapping_overlay(df, mapping_series):
+    """Re-apply category mappings to override Budget_Category values.
+
+    ``mapping_series`` is the (Clean_Description, Bank_Category)-indexed
+    Series from load_mappings; the lookup runs as one vectorized reindex
+    against the frame's own key pairs — no row merge, no Python loop.
+    """
+    if mapping_series.empty:
+        return df
+    keys = pd.MultiIndex.from_arrays([df['Clean_Description'], df['Category']])
+    override = mapping_series.reindex(keys).to_numpy()
+    mask = pd.notna(override)
+    if not mask.any():
         return df
     df = df.copy()
-    overlay = pd.DataFrame([
-        {'Clean_Description': k[0], 'Category': k[1], '_mapped_cat': v}
-        for k, v in mappings_dict.items()
-    ])
-    merged = df.merge(overlay, on=['Clean_Description', 'Category'], how='left')
-    mask = merged['_mapped_cat'].notna()
-    df.loc[mask.values, 'Budget_Category'] = merged.loc[mask, '_mapped_cat'].values
+    if isinstance(df['Budget_Category'].dtype, pd.CategoricalDtype):
+        new_cats = pd.Index(pd.unique(override[mask])).difference(
+            df['Budget_Category'].cat.categories)
+        if len(new_cats):
+            df['Budget_Category'] = df['Budget_Category'].cat.add_categories(new_cats)
+    df.loc[mask, 'Budget_Category'] = override[mask]
     return df
 
+@st.cache_resource
+def make_chart_shell(kind, **layout):
+    """Return a pre-styled empty go.Figure, cached per chart.
+
+    Reruns only swap trace data on the shared figure instead of paying
+    plotly-express figure construction and layout inference each time.
+    ``kind`` keys the cache so charts with identical layouts stay distinct.
+    """
+    fig = go.Figure()
+    fig.update_layout(template="plotly_white", **layout)
+    return fig
+
+@st.cache_data(hash_funcs={pd.DataFrame: _frame_fingerprint})
+def get_year_meta(df_year, year):
+    """Per-year values that don't depend on the month/category filters.
+
+    Computed once per selected year: the sidebar option lists and the
+    cumulative monthly spend series the Forecasting tab plots (previously
+    an O(N log N) sort + resample on every rerun).
+    """
+    # Month-end cumulative spend: sum per calendar month via a period
+    # groupby (hashes month integers directly), then cumsum. Cheaper than
+    # cumsum + resample('ME').last(), which builds a DatetimeIndex grouper
+    # and rescans every row.
+    monthly = df_year.groupby(
+        df_year['Transaction Date'].dt.to_period('M'), sort=True, observed=True
+    )['Net_Amount'].sum().cumsum()
+    monthly.index = monthly.index.to_timestamp(how='end').normalize()
+    return {
+        'months': ['All'] + df_year['Month'].unique().sort_values().tolist(),
+        'categories': ['All'] + sorted(df_year['Budget_Category'].unique().tolist()),
+        'cum_monthly': monthly,
+        'total_spend': df_year['Net_Amount'].sum(),
+    }
+
+@st.cache_data(max_entries=32, ttl="15m", hash_funcs={pd.DataFrame: _frame_fingerprint})
+def filter_transactions(df_year, month, category):
+    """Month/category slice of the year's transactions, cached per selection.
+
+    Builds one combined boolean mask over the raw arrays so the frame is
+    indexed a single time rather than once per active filter.
+    """
+    mask = np.ones(len(df_year), dtype=bool)
+    if month != 'All':
+        mask &= (df_year['Month'].to_numpy() == month)
+    if category != 'All':
+        mask &= (df_year['Budget_Category'].to_numpy() == category)
+    return df_year if mask.all() else df_year.loc[mask]
+
+@st.cache_data(max_entries=32, ttl="15m", hash_funcs={pd.DataFrame: _frame_fingerprint})
+def category_totals(df_filtered):
+    """Spend per budget category — shared by the Top Category metric and pie chart."""
+    # observed+unsorted: skip empty-category rows and the output sort
+    return df_filtered.groupby('Budget_Category', observed=True, sort=False)['Net_Amount'].sum()
+
+@st.cache_data(hash_funcs={pd.DataFrame: _frame_fingerprint})
+def merchant_stats(df_filtered):
+    """Top-10 merchants by spend and top-5 by visit count.
+
+    Runs on the categorical codes with np.bincount (one O(N) pass) and
+    picks the winners with argpartition instead of sorting every merchant.
+    """
+    desc = df_filtered['Clean_Description']
+    codes = desc.cat.codes.to_numpy()
+    amounts = df_filtered['Net_Amount'].to_numpy()
+    if (codes < 0).any():  # drop rows with no description
+        keep = codes >= 0
+        codes, amounts = codes[keep], amounts[keep]
+    counts = np.bincount(codes, minlength=len(desc.cat.categories))
+    sums = np.bincount(codes, weights=amounts, minlength=len(desc.cat.categories))
+    present = np.flatnonzero(counts)
+
+    k = min(10, len(present))
+    top_spend = present[np.argpartition(-sums[present], k - 1)[:k]] if k else present
+    top_spend = top_spend[np.argsort(sums[top_spend])]  # ascending for the h-bar
+    k = min(5, len(present))
+    top_freq = present[np.argpartition(-counts[present], k - 1)[:k]] if k else present
+    top_freq = top_freq[np.argsort(-counts[top_freq])]
+
+    cats = desc.cat.categories
+    return (pd.Series(sums[top_spend], index=cats[top_spend], name='Net_Amount'),
+            pd.Series(counts[top_freq], index=cats[top_freq], name='count'))
+
+@st.cache_data(hash_funcs={pd.DataFrame: _frame_fingerprint})
+def merchant_combo_stats(df_trans):
+    """Manage-tab inputs computed once per dataset load: transaction
+    count/total per (merchant, bank category) combo, and each combo's
+    current fallback Budget_Category."""
+    stats = df_trans.groupby(['Clean_Description', 'Category']).agg(
+        Transactions=('Net_Amount', 'count'),
+        Total_Amount=('Net_Amount', 'sum')
+    ).reset_index()
+    current_cats = df_trans[['Clean_Description', 'Category', 'Budget_Category']].drop_duplicates(
+        subset=['Clean_Description', 'Category'], keep='first'
+    )
+    return stats, current_cats
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: _frame_fingerprint})
+def monthly_rollup(df, value_name):
+    """Per-month Net_Amount totals for a year slice.
+
+    Keyed on the cheap frame fingerprint, so sidebar interactions that
+    don't change the underlying data reuse the grouped result instead of
+    re-aggregating on every rerun.
+    """
+    out = df.groupby('Month_Num')['Net_Amount'].sum().reset_index()
+    out.columns = ['month_num', value_name]
+    return out
+
+@st.cache_data(max_entries=32, ttl="15m", hash_funcs={pd.DataFrame: _frame_fingerprint})
+def month_type_totals(df_filtered):
+    """Fixed/Variable spend per month for the overview stacked bar."""
+    return df_filtered.groupby(['Month_Num', 'spending_type'])['Net_Amount'].sum().reset_index()
+
+@st.cache_data(hash_funcs={pd.DataFrame: _frame_fingerprint})
+def payments_sum(df_payments, year, month):
+    """Cached total of card payments for the selected year/month."""
+    mask = df_payments['Year'].to_numpy() == year
+    if month != 'All':
+        mask &= (df_payments['Month'].to_numpy() == month)
+    return df_payments.loc[mask, 'Amount'].sum()
+
 def save_category_mappings(new_mappings_df):
-    """Merge new mappings into category_mappings.csv (upsert by merchant+bank_category)."""
+    """Merge new mappings into the Parquet store (upsert by merchant+bank_category)."""
     if MAPPINGS_FILE.exists():
-        existing_df = pd.read_csv(MAPPINGS_FILE)
+        existing_df = pd.read_parquet(MAPPINGS_FILE)
         combined_df = pd.concat([existing_df, new_mappings_df], ignore_index=True)
         combined_df = combined_df.drop_duplicates(
             subset=['Clean_Description', 'Bank_Category'], keep='last'
         )
     else:
         combined_df = new_mappings_df
-    combined_df.to_csv(MAPPINGS_FILE, index=False)
+    combined_df.to_parquet(MAPPINGS_FILE, index=False)
 
 # --- Report Generation (cached) ---
 
-@st.cache_data
-def generate_monthly_summary_csv(_df_year_dict, _df_trans_dict, selected_year, selected_month):
-    """Generate a monthly spending summary CSV with comparisons to prior periods."""
-    df_year = pd.DataFrame(_df_year_dict)
-    df_year['Transaction Date'] = pd.to_datetime(df_year['Transaction Date'])
-    df_trans = pd.DataFrame(_df_trans_dict)
-    df_trans['Transaction Date'] = pd.to_datetime(df_trans['Transaction Date'])
-
-    month_num = {v: k for k, v in MONTH_NAMES.items()}.get(selected_month[:3])
+@st.cache_data(hash_funcs={pd.DataFrame: _frame_fingerprint})
+def generate_monthly_summary_csv(df_year, df_trans, selected_year, selected_month):
+    """Generate a monthly spending summary CSV with comparisons to prior periods.
+
+    Takes the frames directly (fingerprint-hashed); callers must not
+    pre-flatten them with to_dict, which materializes a Python object
+    per cell.
+    """
+    month_num = MONTH_NUM_BY_NAME3.get(selected_month[:3])
     if month_num is None:
         try:
             month_num = datetime.datetime.strptime(selected_month, "%B").month
@@ -192,16 +396,18 @@ def generate_monthly_summary_csv(_df_year_dict, _df_trans_dict, selected_year, s
     return summary.to_csv(index=False)
 
 
-@st.cache_data
-def generate_annual_summary_csv(_df_year_dict, _df_income_year_dict, _df_checking_year_dict, selected_year):
-    """Generate an annual summary CSV with monthly breakdown by category."""
-    df_year = pd.DataFrame(_df_year_dict)
-    df_year['Transaction Date'] = pd.to_datetime(df_year['Transaction Date'])
-    df_year['month_num'] = df_year['Transaction Date'].dt.month
+@st.cache_data(hash_funcs={pd.DataFrame: _frame_fingerprint})
+def generate_annual_summary_csv(df_year, df_income_year, df_checking_year, selected_year):
+    """Generate an annual summary CSV with monthly breakdown by category.
 
+    Takes the frames directly (fingerprint-hashed, treated as read-only):
+    month numbers come from local Series so the shared slices are never
+    mutated, and no to_dict round trip is needed at the call sites.
+    """
     pivot = df_year.pivot_table(
-        index='Budget_Category', columns='month_num',
-        values='Net_Amount', aggfunc='sum', fill_value=0
+        index='Budget_Category',
+        columns=df_year['Transaction Date'].dt.month.rename('month_num'),
+        values='Net_Amount', aggfunc='sum', fill_value=0, observed=True
     )
     for m in range(1, 13):
         if m not in pivot.columns:
@@ -211,20 +417,26 @@ def generate_annual_summary_csv(_df_year_dict, _df_income_year_dict, _df_checkin
 
     pivot['Annual_Total'] = pivot.sum(axis=1)
 
-    is_current = (selected_year == datetime.date.today().year)
-    elapsed_months = datetime.date.today().month if is_current else 12
+    today = datetime.date.today()
+    is_current = (selected_year == today.year)
+    elapsed_months = today.month if is_current else 12
     pivot['Monthly_Avg'] = (pivot['Annual_Total'] / elapsed_months).round(2)
 
-    month_cols = [MONTH_NAMES[m] for m in range(1, 13)]
-    pivot['Min_Month'] = pivot[month_cols].replace(0, float('nan')).min(axis=1)
-    pivot['Max_Month'] = pivot[month_cols].max(axis=1)
+    month_cols = MONTH_COL_NAMES
+    # Min over non-zero months without allocating a NaN-ed copy of the pivot
+    month_arr = pivot[month_cols].to_numpy(dtype=float)
+    min_vals = np.where(month_arr == 0, np.inf, month_arr).min(axis=1)
+    pivot['Min_Month'] = np.where(np.isinf(min_vals), np.nan, min_vals)
+    pivot['Max_Month'] = month_arr.max(axis=1)
     pivot = pivot.sort_values('Annual_Total', ascending=False)
 
     monthly_total = pivot[month_cols].sum()
     monthly_total['Annual_Total'] = monthly_total.sum()
     monthly_total['Monthly_Avg'] = (monthly_total['Annual_Total'] / elapsed_months).round(2) if elapsed_months > 0 else 0
-    monthly_total['Min_Month'] = monthly_total[month_cols].replace(0, float('nan')).min()
-    monthly_total['Max_Month'] = monthly_total[month_cols].max()
+    total_arr = monthly_total[month_cols].to_numpy(dtype=float)
+    total_nz = total_arr[total_arr != 0]
+    monthly_total['Min_Month'] = total_nz.min() if total_nz.size else float('nan')
+    monthly_total['Max_Month'] = total_arr.max()
     monthly_total.name = 'MONTHLY TOTAL'
     pivot = pd.concat([pivot, monthly_total.to_frame().T])
 
@@ -232,13 +444,9 @@ def generate_annual_summary_csv(_df_year_dict, _df_income_year_dict, _df_checkin
     monthly_avg_row.name = 'MONTHLY AVERAGE'
     pivot = pd.concat([pivot, monthly_avg_row.to_frame().T])
 
-    df_income_year = pd.DataFrame(_df_income_year_dict)
-    df_checking_year = pd.DataFrame(_df_checking_year_dict)
-
     if not df_income_year.empty and 'Net_Amount' in df_income_year.columns:
-        df_income_year['Transaction Date'] = pd.to_datetime(df_income_year['Transaction Date'])
-        df_income_year['month_num'] = df_income_year['Transaction Date'].dt.month
-        income_monthly = df_income_year.groupby('month_num')['Net_Amount'].sum()
+        income_monthly = df_income_year.groupby(
+            df_income_year['Transaction Date'].dt.month)['Net_Amount'].sum()
 
         income_row = pd.Series(0, index=pivot.columns, name='INCOME')
         for m_num, m_name in MONTH_NAMES.items():
@@ -250,9 +458,8 @@ def generate_annual_summary_csv(_df_year_dict, _df_income_year_dict, _df_checkin
 
         total_exp_row = monthly_total.copy()
         if not df_checking_year.empty and 'Net_Amount' in df_checking_year.columns:
-            df_checking_year['Transaction Date'] = pd.to_datetime(df_checking_year['Transaction Date'])
-            df_checking_year['month_num'] = df_checking_year['Transaction Date'].dt.month
-            ck_monthly = df_checking_year.groupby('month_num')['Net_Amount'].sum()
+            ck_monthly = df_checking_year.groupby(
+                df_checking_year['Transaction Date'].dt.month)['Net_Amount'].sum()
             for m_num, m_name in MONTH_NAMES.items():
                 total_exp_row[m_name] = total_exp_row.get(m_name, 0) + ck_monthly.get(m_num, 0)
             total_exp_row['Annual_Total'] = total_exp_row[month_cols].sum()
@@ -261,17 +468,22 @@ def generate_annual_summary_csv(_df_year_dict, _df_income_year_dict, _df_checkin
         total_exp_row['Min_Month'] = None
         total_exp_row['Max_Month'] = None
 
-        net_row = pd.Series(0, index=pivot.columns, name='NET SAVINGS')
-        for col in month_cols:
-            net_row[col] = income_row[col] - total_exp_row[col]
+        income_vals = income_row[month_cols].to_numpy(dtype=float)
+        exp_vals = total_exp_row[month_cols].to_numpy(dtype=float)
+
+        net_row = pd.Series(0.0, index=pivot.columns, name='NET SAVINGS')
+        net_row[month_cols] = income_vals - exp_vals
         net_row['Annual_Total'] = income_row['Annual_Total'] - total_exp_row['Annual_Total']
         net_row['Monthly_Avg'] = (net_row['Annual_Total'] / elapsed_months).round(2) if elapsed_months > 0 else 0
         net_row['Min_Month'] = None
         net_row['Max_Month'] = None
 
-        rate_row = pd.Series(0, index=pivot.columns, name='SAVINGS RATE')
-        for col in month_cols:
-            rate_row[col] = (net_row[col] / income_row[col] * 100).round(1) if income_row[col] > 0 else 0
+        rate_row = pd.Series(0.0, index=pivot.columns, name='SAVINGS RATE')
+        rate_row[month_cols] = np.where(
+            income_vals > 0,
+            np.round((income_vals - exp_vals) / np.where(income_vals > 0, income_vals, 1) * 100, 1),
+            0
+        )
         rate_row['Annual_Total'] = (net_row['Annual_Total'] / income_row['Annual_Total'] * 100).round(1) if income_row['Annual_Total'] > 0 else 0
         rate_row['Monthly_Avg'] = None
         rate_row['Min_Month'] = None
@@ -291,7 +503,7 @@ def generate_filtered_transactions_csv(df_filtered):
         return pd.DataFrame(columns=['Date', 'Merchant', 'Category', 'Amount', 'Note', 'Tags']).to_csv(index=False)
     cols = [c for c in ['Transaction Date', 'Clean_Description', 'Budget_Category', 'Net_Amount', 'Note', 'Tags']
             if c in df_filtered.columns]
-    export = df_filtered[cols].copy()
+    export = df_filtered[cols]
     export = export.rename(columns={
         'Transaction Date': 'Date', 'Clean_Description': 'Merchant',
         'Budget_Category': 'Category', 'Net_Amount': 'Amount',
@@ -310,7 +522,8 @@ def generate_html_summary(df_filtered, df_income_year, selected_year, selected_m
             top_cats.append(f"{cat}: ${amt:,.2f}")
     biggest = ""
     if not df_filtered.empty:
-        max_row = df_filtered.loc[df_filtered['Net_Amount'].idxmax()]
+        # Positional argmax — robust to non-unique indices after note merges
+        max_row = df_filtered.iloc[df_filtered['Net_Amount'].to_numpy().argmax()]
         biggest = f"{max_row.get('Clean_Description', 'N/A')} \u2014 ${max_row['Net_Amount']:,.2f}"
     savings_line = ""
     if not df_income_year.empty and 'Net_Amount' in df_income_year.columns:
@@ -340,23 +553,68 @@ def generate_html_summary(df_filtered, df_income_year, selected_year, selected_m
 
 # --- Data Loading ---
 
-@st.cache_data
+# Explicit dtypes for the processed CSVs — skips object-dtype inference and
+# keeps amounts at float32 (two-decimal currency doesn't need doubles).
+# Keys missing from a given file are ignored by read_csv.
+CSV_DTYPES = {
+    'Clean_Description': 'category', 'Budget_Category': 'category',
+    'Month': 'category', 'Net_Amount': 'float32', 'Amount': 'float32',
+}
+
+def _read_table(csv_path, columns=None):
+    """Load a processed table, preferring the Parquet twin when the
+    pipeline wrote one — typed and columnar, so no CSV parse at all."""
+    parquet_path = csv_path.with_suffix('.parquet')
+    if parquet_path.exists():
+        return pd.read_parquet(parquet_path, columns=columns)
+    return _read_csv_fast(csv_path, columns)
+
+
+def _table_exists(csv_path):
+    return csv_path.exists() or csv_path.with_suffix('.parquet').exists()
+
+
+def _read_csv_fast(path, columns=None):
+    """Read a CSV into pandas, using polars' multi-threaded parser when available.
+
+    Polars parses dates during the read and hands the result to pandas via
+    Arrow buffers, which dominates cold-start time on the combined CSVs.
+    The pandas fallback uses the multi-threaded pyarrow engine with
+    explicit dtypes, so parsing happens in one typed pass instead of a
+    post-hoc to_datetime, and the parsed columns arrive through Arrow —
+    the same format Streamlit serializes to for the browser.
+    """
+    if pl is not None:
+        return pl.read_csv(str(path), try_parse_dates=True, columns=columns).to_pandas()
+    return pd.read_csv(path, dtype=CSV_DTYPES, usecols=columns,
+                       parse_dates=['Transaction Date'], engine='pyarrow')
+
+
+@st.cache_resource
 def load_data():
+    """Load the master transaction/payment frames once and share them.
+
+    cache_resource keeps a single copy across sessions and reruns (no
+    per-call deep copy); callers must treat the returned frames as
+    read-only and .copy() before mutating.
+    """
     df_trans = pd.DataFrame()
     df_payments = pd.DataFrame()
     try:
         trans_path = DATA_DIR / "all_transactions.csv"
-        if trans_path.exists():
-            df_trans = pd.read_csv(trans_path)
-            df_trans['Transaction Date'] = pd.to_datetime(df_trans['Transaction Date'])
+        if _table_exists(trans_path):
+            # Project to the columns the UI touches; the parquet reader
+            # skips the others entirely, the CSV readers drop them at parse
+            df_trans = _read_table(trans_path, columns=TRANS_LOAD_COLS)
             if 'Year' not in df_trans.columns:
                 df_trans['Year'] = df_trans['Transaction Date'].dt.year
         payments_path = DATA_DIR / "all_credit_card_payments.csv"
-        if payments_path.exists():
-            df_payments = pd.read_csv(payments_path)
-            df_payments['Transaction Date'] = pd.to_datetime(df_payments['Transaction Date'])
+        if _table_exists(payments_path):
+            df_payments = _read_table(payments_path, columns=PAYMENT_LOAD_COLS)
             if 'Year' not in df_payments.columns:
                 df_payments['Year'] = df_payments['Transaction Date'].dt.year
+            df_payments['Amount'] = df_payments['Amount'].astype('float32')
+            df_payments['Year'] = df_payments['Year'].astype('int16')
     except FileNotFoundError:
         st.error("Data files not found. Please run 'Yearly_Spending.py' first.")
         return pd.DataFrame(), pd.DataFrame()
@@ -375,12 +633,8 @@ def load_data():
                     'Category': 'Transfer',
                     'Budget_Category': df_assigned['Budget_Category'],
                     # Force the amount to be negative so it always subtracts from total spending
-                    'Net_Amount': -abs(df_assigned['Net_Amount']),  
-                    'Source': 'Checking Assignment',
-                    'account_type': 'credit',
+                    'Net_Amount': -abs(df_assigned['Net_Amount']),
                     'Month': df_assigned['Transaction Date'].dt.strftime('%B'),
-                    'Quarter': df_assigned['Transaction Date'].dt.quarter,
-                    'Week': df_assigned['Transaction Date'].dt.isocalendar().week,
                     'Year': df_assigned['Transaction Date'].dt.year
                 })
                 # Append offsets to main transactions
@@ -388,32 +642,71 @@ def load_data():
         except pd.errors.EmptyDataError:
             pass
 
+    # Ordered categorical so the sidebar month list comes back pre-sorted
+    if not df_trans.empty and 'Month' in df_trans.columns:
+        df_trans['Month'] = pd.Categorical(df_trans['Month'], categories=MONTH_ORDER_FULL, ordered=True)
+
+    # Category dtype: groupbys/filters on these columns compare int codes
+    # instead of rehashing strings on every rerun
+    if not df_trans.empty:
+        for col in ('Budget_Category', 'Clean_Description', 'Category'):
+            if col in df_trans.columns:
+                df_trans[col] = df_trans[col].astype('category')
+        # Month number and day-of-year precomputed once; tabs group and
+        # plot on them instead of re-deriving dt accessors per rerun
+        df_trans['Month_Num'] = df_trans['Transaction Date'].dt.month.astype('int8')
+        df_trans['DayOfYear'] = df_trans['Transaction Date'].dt.dayofyear.astype('int16')
+        # Narrow numerics: halves the bytes every sum/cumsum touches.
+        # float32 keeps cents exact well past any realistic amount.
+        df_trans['Net_Amount'] = df_trans['Net_Amount'].astype('float32')
+        df_trans['Year'] = df_trans['Year'].astype('int16')
+        # Newest-first once here, so filtered slices show in display order
+        # without a per-rerun sort in the transactions tab; the forecast
+        # and YoY cumulative paths lean on this order too (reversal beats
+        # re-sorting), so keep it if touching this
+        df_trans = df_trans.sort_values('Transaction Date', ascending=False,
+                                        kind='mergesort').reset_index(drop=True)
+
     return df_trans, df_payments
 
-@st.cache_data
+@st.cache_resource
 def load_income_data():
     income_path = DATA_DIR / "all_income.csv"
-    if not income_path.exists():
+    if not _table_exists(income_path):
         return pd.DataFrame()
     try:
-        df = pd.read_csv(income_path)
-        df['Transaction Date'] = pd.to_datetime(df['Transaction Date'])
+        df = _read_table(income_path)
         if 'Year' not in df.columns:
             df['Year'] = df['Transaction Date'].dt.year
+        df['Year'] = df['Year'].astype('int16')
+        df['Month_Num'] = df['Transaction Date'].dt.month.astype('int8')
+        if 'Net_Amount' in df.columns:
+            df['Net_Amount'] = df['Net_Amount'].astype('float32')
+        # Same categorical keys as the transactions load: groupbys hash
+        # int codes instead of strings
+        for col in ('Clean_Description', 'Budget_Category', 'Category', 'Income_Source'):
+            if col in df.columns:
+                df[col] = df[col].astype('category')
         return df
     except Exception:
         return pd.DataFrame()
 
-@st.cache_data
+@st.cache_resource
 def load_checking_spending():
     checking_path = DATA_DIR / "all_checking_spending.csv"
-    if not checking_path.exists():
+    if not _table_exists(checking_path):
         return pd.DataFrame()
     try:
-        df = pd.read_csv(checking_path)
-        df['Transaction Date'] = pd.to_datetime(df['Transaction Date'])
+        df = _read_table(checking_path)
         if 'Year' not in df.columns:
             df['Year'] = df['Transaction Date'].dt.year
+        df['Year'] = df['Year'].astype('int16')
+        df['Month_Num'] = df['Transaction Date'].dt.month.astype('int8')
+        if 'Net_Amount' in df.columns:
+            df['Net_Amount'] = df['Net_Amount'].astype('float32')
+        for col in ('Clean_Description', 'Budget_Category', 'Category'):
+            if col in df.columns:
+                df[col] = df[col].astype('category')
         return df
     except Exception:
         return pd.DataFrame()
@@ -430,9 +723,9 @@ df_income = load_income_data()
 df_checking = load_checking_spending()
 
 # Apply mapping overlay
-mappings_dict = load_mappings()
-if not df_trans.empty and mappings_dict:
-    df_trans = apply_mapping_overlay(df_trans, mappings_dict)
+mapping_series = load_mappings()
+if not df_trans.empty and not mapping_series.empty:
+    df_trans = apply_mapping_overlay(df_trans, mapping_series)
 
 # Merge transaction notes/tags
 notes_df = load_transaction_notes()
@@ -453,29 +746,29 @@ with st.sidebar:
     default_year_index = available_years.index(current_year) if current_year in available_years else 0
     selected_year = st.selectbox("Select Year", available_years, index=default_year_index)
 
-    df_year = df_trans[df_trans['Year'] == selected_year].copy()
-    df_income_year = df_income[df_income['Year'] == selected_year].copy() if not df_income.empty else pd.DataFrame()
-    df_checking_year = df_checking[df_checking['Year'] == selected_year].copy() if not df_checking.empty else pd.DataFrame()
+    # Year slices come from the cached per-year split: a dict lookup,
+    # no full-column scan per rerun. The slices are shared read-only.
+    df_year = split_by_year(df_trans).get(selected_year, df_trans.iloc[0:0])
+    df_income_year = split_by_year(df_income).get(selected_year, pd.DataFrame())
+    df_checking_year = split_by_year(df_checking).get(selected_year, pd.DataFrame())
 
     # Recurring detection
-    df_for_recurring = df_year.copy()
+    df_for_recurring = df_year
     if not df_checking_year.empty:
-        checking_for_recurring = df_checking_year.copy()
+        checking_for_recurring = df_checking_year
         if 'Budget_Category' not in checking_for_recurring.columns:
-            checking_for_recurring['Budget_Category'] = 'Personal'
+            checking_for_recurring = checking_for_recurring.assign(Budget_Category='Personal')
         common_cols = [c for c in df_for_recurring.columns if c in checking_for_recurring.columns]
         df_for_recurring = pd.concat([df_for_recurring[common_cols], checking_for_recurring[common_cols]], ignore_index=True)
 
-    _recurring_dict, subscription_alerts = get_recurring_analysis(df_for_recurring.to_dict('list'))
-    recurring_merchants = pd.DataFrame(_recurring_dict)
-    df_year = classify_transactions(df_year, recurring_merchants)
+    recurring_merchants, subscription_alerts = get_recurring_analysis(df_for_recurring)
+    df_year = classify_cached(df_year, recurring_merchants)
     if not df_checking_year.empty:
-        df_checking_year = classify_transactions(df_checking_year, recurring_merchants)
+        df_checking_year = classify_cached(df_checking_year, recurring_merchants)
 
-    months = ['All'] + sorted(df_year['Month'].unique().tolist(), key=lambda m: datetime.datetime.strptime(m, "%B").month)
-    selected_month = st.selectbox("Select Month", months)
-    categories = ['All'] + sorted(df_year['Budget_Category'].unique().tolist())
-    selected_category = st.selectbox("Select Budget Category", categories)
+    year_meta = get_year_meta(df_year, selected_year)
+    selected_month = st.selectbox("Select Month", year_meta['months'])
+    selected_category = st.selectbox("Select Budget Category", year_meta['categories'])
     available_tags = get_available_tags(notes_df)
     selected_tags = st.multiselect("Filter by Tags", available_tags)
 
@@ -483,11 +776,7 @@ with st.sidebar:
     st.caption(f"Last Updated: {datetime.date.today()}")
 
 # Apply Filters
-df_filtered = df_year.copy()
-if selected_month != 'All':
-    df_filtered = df_filtered[df_filtered['Month'] == selected_month]
-if selected_category != 'All':
-    df_filtered = df_filtered[df_filtered['Budget_Category'] == selected_category]
+df_filtered = filter_transactions(df_year, selected_month, selected_category)
 if selected_tags:
     df_filtered = filter_by_tags(df_filtered, selected_tags)
 
@@ -498,25 +787,26 @@ st.markdown("Taking control of personal finances, one data point at a time.")
 st.markdown("<br>", unsafe_allow_html=True)
 
 col1, col2, col3, col4 = st.columns(4)
-total_spend = df_filtered['Net_Amount'].sum()
+cat_totals = (category_totals(df_filtered) if not df_filtered.empty
+              else pd.Series(dtype=float, name='Net_Amount').rename_axis('Budget_Category'))
+# The grand total folds out of the cached per-category sums — no second
+# full-column reduction.
+total_spend = cat_totals.sum()
 tx_count = len(df_filtered)
 
 total_payments_made = 0
 if not df_payments.empty and 'Year' in df_payments.columns:
-    pay_view = df_payments[df_payments['Year'] == selected_year].copy()
-    if selected_month != 'All':
-        pay_view = pay_view[pay_view['Month'] == selected_month]
-    total_payments_made = pay_view['Amount'].sum()
+    total_payments_made = payments_sum(df_payments, selected_year, selected_month)
 
 with col1:
     st.metric("Total Spending", f"${total_spend:,.2f}")
 with col2:
     st.metric("Transactions", f"{tx_count}")
+
 with col3:
-    if not df_filtered.empty:
-        top_cat = df_filtered.groupby('Budget_Category')['Net_Amount'].sum().idxmax()
-        top_cat_amount = df_filtered.groupby('Budget_Category')['Net_Amount'].sum().max()
-        st.metric("Top Category", top_cat, f"${top_cat_amount:,.0f}")
+    if not cat_totals.empty:
+        top_cat = cat_totals.idxmax()
+        st.metric("Top Category", top_cat, f"${cat_totals.loc[top_cat]:,.0f}")
     else:
         st.metric("Top Category", "N/A", "$0")
 with col4:
@@ -531,32 +821,47 @@ tab_overview, tab_vendor, tab_transactions, tab_forecast, tab_yoy, tab_recurring
      "📈 Year Comparison", "🔄 Recurring", "💰 Income & Cash Flow", "⚙️ Manage Categories", "🤝 Reimbursements"])
 
 # TAB 1: OVERVIEW
-with tab_overview:
+@st.fragment
+def render_overview_tab():
     col_chart1, col_chart2 = st.columns([2, 1])
 
     with col_chart1:
         st.subheader("Spending Trend Over Time")
-        time_group = df_filtered.groupby('Transaction Date')['Net_Amount'].sum().reset_index()
+        # Floor to day so sub-day timestamps collapse into one point each
+        time_group = df_filtered.groupby(
+            df_filtered['Transaction Date'].dt.floor('D'))['Net_Amount'].sum()
         # Fix abs() issue so reimbursements reflect properly as a net drop
-        # time_group['Net_Amount'] = abs(time_group['Net_Amount']) <- REMOVED to allow negative net days
-
-        fig_trend = px.line(time_group, x='Transaction Date', y='Net_Amount',
-                            markers=True, line_shape='spline')
-        fig_trend.update_traces(line_color='#3B82F6', line_width=3)
-        fig_trend.update_layout(height=350, xaxis_title="", yaxis_title="Amount ($)", template="plotly_white")
+        # time_group = time_group.abs() <- REMOVED to allow negative net days
+
+        fig_trend = make_chart_shell('overview_trend', height=350, xaxis_title="",
+                                     yaxis_title="Amount ($)")
+        fig_trend.data = ()
+        # Scattergl renders on canvas instead of SVG, which stays fast on
+        # long series; plain ndarrays skip Plotly's per-column coercion.
+        line_style = dict(color='#3B82F6', width=3)
+        if len(time_group) > 500:
+            trace_cls = go.Scattergl  # WebGL; doesn't support spline smoothing
+        else:
+            trace_cls = go.Scatter
+            line_style['shape'] = 'spline'
+        fig_trend.add_trace(trace_cls(
+            x=time_group.index.values, y=time_group.values,
+            mode='lines+markers', line=line_style))
         st.plotly_chart(fig_trend, use_container_width=True)
 
     with col_chart2:
         st.subheader("Category Split")
-        # UPDATED: Pi chart now uses Budget_Category
-        cat_group = df_filtered.groupby('Budget_Category')['Net_Amount'].sum().reset_index()
-        # The clip(lower=0) natively handles cases where reimbursements > spending in a category
-        cat_group['Net_Amount'] = cat_group['Net_Amount'].clip(lower=0)
-
-        fig_pie = px.pie(cat_group, values='Net_Amount', names='Budget_Category', hole=0.6,
-                              color_discrete_sequence=px.colors.qualitative.Prism)
-
-        fig_pie.update_layout(height=350, showlegend=False, margin=dict(t=0, b=0, l=0, r=0))
+        # UPDATED: Pi chart now uses Budget_Category (reuses the cached totals)
+        # The floor at 0 natively handles cases where reimbursements > spending
+        # in a category; one ufunc call on the ndarray, no intermediate Series.
+        pie_values = np.maximum(cat_totals.to_numpy(), 0)
+
+        fig_pie = make_chart_shell('overview_pie', height=350, showlegend=False,
+                                   margin=dict(t=0, b=0, l=0, r=0))
+        fig_pie.data = ()
+        fig_pie.add_trace(go.Pie(
+            values=pie_values, labels=cat_totals.index.to_numpy(),
+            hole=0.6, marker=dict(colors=px.colors.qualitative.Prism)))
         st.plotly_chart(fig_pie, use_container_width=True)
 
     # Fixed vs. Variable Spending Breakdown
@@ -564,8 +869,10 @@ with tab_overview:
         st.markdown("---")
         st.subheader("Fixed vs. Variable Spending")
 
-        fixed_total = df_filtered[df_filtered['spending_type'] == 'Fixed']['Net_Amount'].sum()
-        variable_total = df_filtered[df_filtered['spending_type'] == 'Variable']['Net_Amount'].sum()
+        # One grouped pass over Net_Amount instead of two masked sums
+        fv_totals = df_filtered.groupby('spending_type', observed=True)['Net_Amount'].sum()
+        fixed_total = fv_totals.get('Fixed', 0)
+        variable_total = fv_totals.get('Variable', 0)
         total_fv = fixed_total + variable_total
         fixed_pct = (fixed_total / total_fv * 100) if total_fv > 0 else 0
         variable_pct = (variable_total / total_fv * 100) if total_fv > 0 else 0
@@ -580,69 +887,66 @@ with tab_overview:
             graph_fixed = max(0, fixed_total)
             graph_var = max(0, variable_total)
             
-            fv_data = pd.DataFrame({
-                'Type': ['Fixed', 'Variable'],
-                'Amount': [graph_fixed, graph_var]
-            })
-            fig_fv = px.pie(fv_data, values='Amount', names='Type', hole=0.65,
-                            color='Type',
-                            color_discrete_map={'Fixed': '#EF4444', 'Variable': '#3B82F6'})
-            fig_fv.update_layout(height=200, showlegend=True,
-                                 margin=dict(t=0, b=0, l=10, r=10))
+            fig_fv = make_chart_shell('overview_fv_pie', height=200, showlegend=True,
+                                      margin=dict(t=0, b=0, l=10, r=10))
+            fig_fv.data = ()
+            fig_fv.add_trace(go.Pie(
+                values=[graph_fixed, graph_var], labels=['Fixed', 'Variable'],
+                hole=0.65, marker=dict(colors=['#EF4444', '#3B82F6'])))
             st.plotly_chart(fig_fv, use_container_width=True)
 
-        # Stacked bar: Fixed vs Variable per month
-        df_fv = df_filtered.copy()
-        df_fv['month_num'] = df_fv['Transaction Date'].dt.month
-        month_fv = df_fv.groupby(['month_num', 'spending_type'])['Net_Amount'].sum().reset_index()
-        month_names_map = {
-            1: 'Jan', 2: 'Feb', 3: 'Mar', 4: 'Apr', 5: 'May', 6: 'Jun',
-            7: 'Jul', 8: 'Aug', 9: 'Sep', 10: 'Oct', 11: 'Nov', 12: 'Dec'
-        }
-        month_fv['Month'] = month_fv['month_num'].map(month_names_map)
-        month_fv = month_fv.sort_values('month_num')
-
-        fig_stacked = px.bar(
-            month_fv, x='Month', y='Net_Amount', color='spending_type',
-            barmode='stack',
-            labels={'Net_Amount': 'Amount ($)', 'spending_type': 'Type'},
-            color_discrete_map={'Fixed': '#EF4444', 'Variable': '#3B82F6'}
-        )
-        fig_stacked.update_layout(
-            title="Monthly Spending: Fixed vs. Variable",
-            template="plotly_white", height=350,
-            legend_title_text=""
-        )
+        # Stacked bar: Fixed vs Variable per month (cached; cache_data
+        # hands back a copy, so the added columns don't leak into it)
+        month_fv = month_type_totals(df_filtered)
+        month_fv['Month'] = month_fv['Month_Num'].map(MONTH_ABBR_BY_NUM)
+        month_fv = month_fv.sort_values('Month_Num')
+
+        fig_stacked = make_chart_shell('overview_fv_stacked', barmode='stack', height=350,
+                                       title="Monthly Spending: Fixed vs. Variable",
+                                       yaxis_title="Amount ($)", legend_title_text="")
+        fig_stacked.data = ()
+        for stype, color in (('Fixed', '#EF4444'), ('Variable', '#3B82F6')):
+            sub = month_fv[month_fv['spending_type'] == stype]
+            fig_stacked.add_trace(go.Bar(
+                x=sub['Month'], y=sub['Net_Amount'], name=stype, marker_color=color))
         st.plotly_chart(fig_stacked, use_container_width=True)
 
 # TAB 2: VENDOR ANALYSIS
-with tab_vendor:
+@st.fragment
+def render_vendor_tab():
     st.subheader("Where does the money actually go?")
     col_v1, col_v2 = st.columns([2, 1])
     with col_v1:
-        merchant_group = df_filtered.groupby('Clean_Description')['Net_Amount'].sum().sort_values(ascending=True).tail(10)
-        fig_bar = go.Figure(go.Bar(
+        merchant_group, freq_merchants = merchant_stats(df_filtered)
+        fig_bar = make_chart_shell('vendor_bar', title="Top 10 Merchants by Spend", height=500)
+        fig_bar.data = ()
+        fig_bar.add_trace(go.Bar(
             x=merchant_group.values,
             y=merchant_group.index,
             orientation='h',
             marker_color='#6366f1'
         ))
-        fig_bar.update_layout(title="Top 10 Merchants by Spend", height=500, template="plotly_white")
         st.plotly_chart(fig_bar, use_container_width=True)
     with col_v2:
         st.info("💡 **Insight:** This view helps you identify 'Subscription Creep' or frequent small purchases that add up.")
         st.write("**Top 5 Most Frequent Places**")
-        freq_merchants = df_filtered['Clean_Description'].value_counts().head(5)
         st.table(freq_merchants)
 
 # TAB 3: TRANSACTION DATA
-with tab_transactions:
+@st.fragment
+def render_transactions_tab():
     st.subheader("Detailed Transaction Log")
 
-    # UPDATED: Table now displays Budget_Category instead of bank Category
+    # UPDATED: Table now displays Budget_Category instead of bank Category.
+    # df_trans is pre-sorted newest-first in load_data; cap rows so the
+    # Arrow payload serialized per rerun stays bounded — only ~15 rows fit
+    # on screen anyway, and the full set is downloadable below.
+    total_rows = len(df_filtered)
+    row_cap = st.number_input("Rows to display", min_value=100, max_value=5000,
+                              value=500, step=100)
     st.dataframe(
         df_filtered[['Transaction Date', 'Clean_Description', 'Budget_Category', 'Net_Amount']]
-        .sort_values('Transaction Date', ascending=False),
+        .head(row_cap),
         column_config={
             "Transaction Date": st.column_config.DateColumn("Date", format="YYYY-MM-DD"),
             "Clean_Description": st.column_config.TextColumn("Merchant"),
@@ -657,9 +961,19 @@ with tab_transactions:
         height=600,
         hide_index=True
     )
+    if total_rows > row_cap:
+        st.caption(f"Showing the newest {row_cap:,} of {total_rows:,} transactions.")
+    st.download_button(
+        "Download full log (CSV)",
+        # Deferred: the full CSV is only serialized when clicked
+        lambda: generate_filtered_transactions_csv(df_filtered),
+        file_name=f"transactions_{selected_year}.csv",
+        mime="text/csv",
+    )
 
 # TAB 4: FORECASTING
-with tab_forecast:
+@st.fragment
+def render_forecast_tab():
     is_current_year = (selected_year == datetime.date.today().year)
     days_in_year = 366 if calendar.isleap(selected_year) else 365
 
@@ -671,13 +985,16 @@ with tab_forecast:
         if days_passed < 1:
             days_passed = 1
 
-        total_spend_ytd = df_year['Net_Amount'].sum()
+        total_spend_ytd = year_meta['total_spend']
         daily_avg = total_spend_ytd / days_passed
         projected_total = daily_avg * days_in_year
     else:
         st.subheader(f"{selected_year} Year in Review")
-        total_spend_ytd = df_year['Net_Amount'].sum()
-        days_with_data = (df_year['Transaction Date'].max() - df_year['Transaction Date'].min()).days
+        total_spend_ytd = year_meta['total_spend']
+        # Slice is newest-first, so the date span is a pair of positional
+        # lookups instead of two full-column scans
+        dates = df_year['Transaction Date']
+        days_with_data = (dates.iloc[0] - dates.iloc[-1]).days
         if days_with_data < 1:
             days_with_data = 1
         daily_avg = total_spend_ytd / days_with_data
@@ -695,30 +1012,40 @@ with tab_forecast:
 
     year_start = f'{selected_year}-01-01'
     year_end = f'{selected_year}-12-31'
-    dates = pd.date_range(start=year_start, end=year_end, freq='M')
+    dates = pd.date_range(start=year_start, end=year_end, freq='ME')
 
-    fig_proj = go.Figure()
+    proj_title = ("Actual Cumulative Spend vs. Projected Path" if is_current_year
+                  else f"Cumulative Spend for {selected_year}")
+    fig_proj = make_chart_shell('forecast_proj', title=proj_title, hovermode="x unified")
+    fig_proj.data = ()
 
     if is_current_year:
-        projection_values = [daily_avg * d.day_of_year for d in dates]
+        projection_values = daily_avg * dates.dayofyear.to_numpy()
         fig_proj.add_trace(go.Scatter(
             x=dates, y=projection_values, mode='lines',
             name='Projection', line=dict(dash='dot', color='gray')))
 
-    actual_cum = df_year.sort_values('Transaction Date').set_index('Transaction Date')['Net_Amount'].cumsum()
-    actual_cum_resampled = actual_cum.resample('ME').last()
+    actual_cum_resampled = year_meta['cum_monthly']
 
     fig_proj.add_trace(go.Scatter(
         x=actual_cum_resampled.index, y=actual_cum_resampled.values,
         mode='lines+markers', name='Actual Spending',
         line=dict(color='#3B82F6', width=4)))
 
-    title = "Actual Cumulative Spend vs. Projected Path" if is_current_year else f"Cumulative Spend for {selected_year}"
-    fig_proj.update_layout(title=title, template="plotly_white", hovermode="x unified")
     st.plotly_chart(fig_proj, use_container_width=True)
 
+with tab_overview:
+    render_overview_tab()
+with tab_vendor:
+    render_vendor_tab()
+with tab_transactions:
+    render_transactions_tab()
+with tab_forecast:
+    render_forecast_tab()
+
 # TAB 5: YEAR-OVER-YEAR COMPARISON
-with tab_yoy:
+@st.fragment
+def render_yoy_tab():
     available_years_list = sorted(df_trans['Year'].unique().tolist())
 
     if len(available_years_list) < 2:
@@ -736,12 +1063,15 @@ with tab_yoy:
         if len(compare_years) < 2:
             st.warning("Please select at least 2 years to compare.")
         else:
-            df_compare = df_trans[df_trans['Year'].isin(compare_years)].copy()
-            df_compare['Month_Num'] = df_compare['Transaction Date'].dt.month
-            df_compare['Month_Name'] = df_compare['Transaction Date'].dt.strftime('%b')
-            # Convert Year to string for chart legends
-            compare_years_str = [str(y) for y in sorted(compare_years)]
-            df_compare['Year'] = df_compare['Year'].astype(str)
+            # Carry only the columns the charts touch — the wide note/
+            # tag/merchant string columns never get copied
+            df_compare = df_trans.loc[df_trans['Year'].isin(compare_years),
+                                      ['Year', 'Transaction Date', 'Budget_Category',
+                                       'Net_Amount', 'Month_Num', 'DayOfYear']]
+            df_compare['Month_Name'] = df_compare['Month_Num'].map(MONTH_ABBR_BY_NUM)
+            # Year stays int16 — px.line/px.bar treat a color column as
+            # discrete regardless of dtype, so no str conversion pass
+            compare_years_sorted = sorted(compare_years)
 
             # Chart 1: Monthly Spending Overlay
             st.markdown("#### Monthly Spending by Year")
@@ -751,7 +1081,8 @@ with tab_yoy:
             fig_monthly = px.line(
                 monthly, x='Month_Name', y='Net_Amount', color='Year',
                 markers=True, labels={'Net_Amount': 'Total Spend ($)', 'Month_Name': 'Month'},
-                color_discrete_sequence=px.colors.qualitative.Set2
+                color_discrete_sequence=px.colors.qualitative.Set2,
+                category_orders={'Year': compare_years_sorted}
             )
             fig_monthly.update_layout(template="plotly_white", hovermode="x unified")
             st.plotly_chart(fig_monthly, use_container_width=True)
@@ -763,22 +1094,26 @@ with tab_yoy:
             fig_cat = px.bar(
                 cat_compare, x='Budget_Category', y='Net_Amount', color='Year',
                 barmode='group', labels={'Net_Amount': 'Total ($)', 'Budget_Category': 'Category'},
-                color_discrete_sequence=px.colors.qualitative.Set2
+                color_discrete_sequence=px.colors.qualitative.Set2,
+                category_orders={'Year': compare_years_sorted}
             )
             fig_cat.update_layout(template="plotly_white", xaxis_tickangle=-45)
             st.plotly_chart(fig_cat, use_container_width=True)
 
             # Chart 3: Cumulative Spending Curves
             st.markdown("#### Cumulative Spending Through the Year")
-            fig_cum = go.Figure()
-            for year_str in compare_years_str:
-                yr_data = df_compare[df_compare['Year'] == year_str].sort_values('Transaction Date').copy()
-                yr_data['DayOfYear'] = yr_data['Transaction Date'].dt.dayofyear
-                yr_data['Cumulative'] = yr_data['Net_Amount'].cumsum()
-                fig_cum.add_trace(go.Scatter(
-                    x=yr_data['DayOfYear'], y=yr_data['Cumulative'],
-                    mode='lines', name=year_str, line=dict(width=3)
-                ))
+            # One groupby-cumsum over all selected years instead of a
+            # Python sort/cumsum per year. df_trans is newest-first, so
+            # reversing the slice gives date-ascending order for free and
+            # the per-year cumsum comes out correct without a sort.
+            df_cum = df_compare.iloc[::-1].copy()
+            df_cum['Cumulative'] = df_cum.groupby('Year', observed=True)['Net_Amount'].cumsum()
+            fig_cum = px.line(
+                df_cum, x='DayOfYear', y='Cumulative', color='Year',
+                color_discrete_sequence=px.colors.qualitative.Set2,
+                category_orders={'Year': compare_years_sorted}
+            )
+            fig_cum.update_traces(line=dict(width=3))
             fig_cum.update_layout(
                 template="plotly_white",
                 xaxis_title="Day of Year", yaxis_title="Cumulative Spend ($)",
@@ -788,15 +1123,14 @@ with tab_yoy:
 
             # Table: YoY Change by Category
             st.markdown("#### Year-over-Year Change by Category")
-            if len(compare_years_str) == 2:
-                yr_old, yr_new = compare_years_str
-                old_cats = df_compare[df_compare['Year'] == yr_old].groupby('Budget_Category')['Net_Amount'].sum()
-                new_cats = df_compare[df_compare['Year'] == yr_new].groupby('Budget_Category')['Net_Amount'].sum()
-
-                change_df = pd.DataFrame({
-                    f'{yr_old} Total': old_cats,
-                    f'{yr_new} Total': new_cats
-                }).fillna(0)
+            if len(compare_years_sorted) == 2:
+                yr_old, yr_new = compare_years_sorted
+                # One grouped pass + unstack instead of a filter-and-
+                # groupby per year; year columns come out ascending,
+                # zero-filled
+                change_df = df_compare.groupby(['Budget_Category', 'Year'], observed=True)['Net_Amount'] \
+                    .sum().unstack('Year', fill_value=0)
+                change_df.columns = [f'{c} Total' for c in change_df.columns]
                 change_df['Change ($)'] = change_df[f'{yr_new} Total'] - change_df[f'{yr_old} Total']
                 change_df['Change (%)'] = (
                     (change_df['Change ($)'] / change_df[f'{yr_old} Total'].replace(0, float('nan'))) * 100
@@ -820,7 +1154,8 @@ with tab_yoy:
                 )
 
 # TAB 6: RECURRING EXPENSES
-with tab_recurring:
+@st.fragment
+def render_recurring_tab():
     st.subheader("Recurring Expenses & Subscriptions")
     st.caption("Auto-detected charges that appear monthly with consistent amounts.")
 
@@ -832,7 +1167,10 @@ with tab_recurring:
         total_monthly_fixed = recurring_merchants['Monthly_Amount'].sum()
         total_annual_fixed = recurring_merchants['Annual_Projected'].sum()
         total_year_spend = df_year['Net_Amount'].sum()
-        recurring_actual = df_year[df_year['is_recurring']]['Net_Amount'].sum()
+        # One mask application shared with the trend below — no second
+        # boolean scan or slice copy just for the metric
+        recurring_mask = df_year['is_recurring'].to_numpy()
+        recurring_actual = df_year['Net_Amount'].to_numpy()[recurring_mask].sum()
         recurring_pct = (recurring_actual / total_year_spend * 100) if total_year_spend > 0 else 0
 
         col_r1, col_r2, col_r3 = st.columns(3)
@@ -899,15 +1237,10 @@ with tab_recurring:
 
         # Monthly Recurring Spend Trend
         st.markdown("#### Monthly Recurring Spend")
-        recurring_tx = df_year[df_year['is_recurring']].copy()
+        recurring_tx = df_year.loc[recurring_mask]
         if not recurring_tx.empty:
-            month_names_map = {
-                1: 'Jan', 2: 'Feb', 3: 'Mar', 4: 'Apr', 5: 'May', 6: 'Jun',
-                7: 'Jul', 8: 'Aug', 9: 'Sep', 10: 'Oct', 11: 'Nov', 12: 'Dec'
-            }
-            recurring_tx['month_num'] = recurring_tx['Transaction Date'].dt.month
-            monthly_recurring = recurring_tx.groupby('month_num')['Net_Amount'].sum().reset_index()
-            monthly_recurring['Month_Name'] = monthly_recurring['month_num'].map(month_names_map)
+            monthly_recurring = recurring_tx.groupby('Month_Num')['Net_Amount'].sum().reset_index()
+            monthly_recurring['Month_Name'] = monthly_recurring['Month_Num'].map(MONTH_ABBR_BY_NUM)
 
             fig_rec_trend = px.bar(
                 monthly_recurring, x='Month_Name', y='Net_Amount',
@@ -918,7 +1251,8 @@ with tab_recurring:
             st.plotly_chart(fig_rec_trend, use_container_width=True)
 
 # TAB 7: INCOME & CASH FLOW
-with tab_cashflow:
+@st.fragment
+def render_cashflow_tab():
     st.subheader("Income & Cash Flow")
 
     if df_income_year.empty:
@@ -955,37 +1289,26 @@ with tab_cashflow:
         # --- Monthly Income vs Expenses Chart ---
         st.subheader("Monthly Income vs Expenses")
 
-        month_names_map = {
-            1: 'Jan', 2: 'Feb', 3: 'Mar', 4: 'Apr', 5: 'May', 6: 'Jun',
-            7: 'Jul', 8: 'Aug', 9: 'Sep', 10: 'Oct', 11: 'Nov', 12: 'Dec'
-        }
-
-        # Monthly income
-        df_income_year['month_num'] = df_income_year['Transaction Date'].dt.month
-        monthly_income = df_income_year.groupby('month_num')['Net_Amount'].sum().reset_index()
-        monthly_income.columns = ['month_num', 'Income']
-
-        # Monthly expenses (credit + checking)
-        df_year_copy = df_year.copy()
-        df_year_copy['month_num'] = df_year_copy['Transaction Date'].dt.month
-        monthly_cc = df_year_copy.groupby('month_num')['Net_Amount'].sum().reset_index()
-        monthly_cc.columns = ['month_num', 'CC_Expenses']
+        # Monthly income/expenses via the cached per-month rollup —
+        # grouped once per dataset, reused across reruns
+        monthly_income = monthly_rollup(df_income_year, 'Income')
+        monthly_cc = monthly_rollup(df_year, 'CC_Expenses')
 
-        monthly_ck_exp = pd.DataFrame({'month_num': range(1, 13), 'Checking_Expenses': 0})
+        # Merge all monthly data; the reindex pins a sorted, zero-filled
+        # 12-month axis, so no pre-built zero scaffold or explicit sort
+        monthly_cf = monthly_income.merge(monthly_cc, on='month_num', how='outer')
         if not df_checking_year.empty:
-            df_ck_copy = df_checking_year.copy()
-            df_ck_copy['month_num'] = df_ck_copy['Transaction Date'].dt.month
-            monthly_ck_exp = df_ck_copy.groupby('month_num')['Net_Amount'].sum().reset_index()
-            monthly_ck_exp.columns = ['month_num', 'Checking_Expenses']
-
-        # Merge all monthly data
-        monthly_cf = monthly_income.merge(monthly_cc, on='month_num', how='outer') \
-                                   .merge(monthly_ck_exp, on='month_num', how='outer') \
-                                   .fillna(0)
+            monthly_cf = monthly_cf.merge(
+                monthly_rollup(df_checking_year, 'Checking_Expenses'),
+                on='month_num', how='outer')
+        monthly_cf = monthly_cf.set_index('month_num') \
+                               .reindex(range(1, 13), fill_value=0).fillna(0) \
+                               .reset_index()
+        if 'Checking_Expenses' not in monthly_cf.columns:
+            monthly_cf['Checking_Expenses'] = 0
         monthly_cf['Total_Expenses'] = monthly_cf['CC_Expenses'] + monthly_cf['Checking_Expenses']
         monthly_cf['Net_Savings'] = monthly_cf['Income'] - monthly_cf['Total_Expenses']
-        monthly_cf['Month'] = monthly_cf['month_num'].map(month_names_map)
-        monthly_cf = monthly_cf.sort_values('month_num')
+        monthly_cf['Month'] = monthly_cf['month_num'].map(MONTH_ABBR_BY_NUM)
 
         fig_cf = go.Figure()
         fig_cf.add_trace(go.Bar(
@@ -1040,22 +1363,19 @@ with tab_cashflow:
         st.markdown("---")
         st.subheader("Debit vs Credit Card Spending")
 
-        df_year_copy['source_type'] = 'Credit Card'
-        debit_monthly = pd.DataFrame({'month_num': range(1, 13), 'Amount': 0, 'source_type': 'Checking/Debit'})
-        if not df_checking_year.empty:
-            df_ck_m = df_checking_year.copy()
-            df_ck_m['month_num'] = df_ck_m['Transaction Date'].dt.month
-            debit_monthly = df_ck_m.groupby('month_num')['Net_Amount'].sum().reset_index()
-            debit_monthly.columns = ['month_num', 'Amount']
-            debit_monthly['source_type'] = 'Checking/Debit'
-
-        credit_monthly = df_year_copy.groupby('month_num')['Net_Amount'].sum().reset_index()
-        credit_monthly.columns = ['month_num', 'Amount']
+        credit_monthly = monthly_rollup(df_year, 'Amount')
         credit_monthly['source_type'] = 'Credit Card'
 
-        combined_sources = pd.concat([credit_monthly, debit_monthly], ignore_index=True)
-        combined_sources['Month'] = combined_sources['month_num'].map(month_names_map)
-        combined_sources = combined_sources.sort_values('month_num')
+        # Both rollups come back month-sorted from the groupby, so no
+        # re-sort after the concat; with no checking data the debit
+        # source simply contributes no rows (no 12-row zero scaffold)
+        source_parts = [credit_monthly]
+        if not df_checking_year.empty:
+            debit_monthly = monthly_rollup(df_checking_year, 'Amount')
+            debit_monthly['source_type'] = 'Checking/Debit'
+            source_parts.append(debit_monthly)
+        combined_sources = pd.concat(source_parts, ignore_index=True)
+        combined_sources['Month'] = combined_sources['month_num'].map(MONTH_ABBR_BY_NUM)
 
         fig_sources = px.bar(
             combined_sources, x='Month', y='Amount', color='source_type',
@@ -1088,45 +1408,39 @@ with tab_cashflow:
         )
 
 # TAB 8: MANAGE CATEGORIES
-with tab_manage:
+@st.fragment
+def render_manage_tab():
     st.subheader("Category Mapping Manager")
     st.caption("Review and assign budget categories to merchants. "
                "Merchants not in the mappings file are flagged as unreviewed.")
 
     # Identify unreviewed merchants across ALL data (not just filtered)
-    all_combos = df_trans[['Clean_Description', 'Category']].drop_duplicates()
-    reviewed_keys = set(mappings_dict.keys())
+    # Full-frame groupby/dedup cached per dataset load — these don't
+    # depend on any filter and otherwise re-ran on every interaction
+    combo_stats, current_cats = merchant_combo_stats(df_trans)
+    all_combos = combo_stats[['Clean_Description', 'Category']]
 
-    unreviewed_mask = all_combos.apply(
-        lambda r: (r['Clean_Description'], r['Category']) not in reviewed_keys, axis=1
-    )
-    unreviewed_combos = all_combos[unreviewed_mask].copy()
-
-    # Enrich with transaction count and total spend
-    merchant_stats = df_trans.groupby(['Clean_Description', 'Category']).agg(
-        Transactions=('Net_Amount', 'count'),
-        Total_Amount=('Net_Amount', 'sum')
-    ).reset_index()
+    # Anti-join against the mapping index: C-level hashed membership test
+    # instead of a Python lambda per merchant combo
+    combo_idx = pd.MultiIndex.from_arrays(
+        [all_combos['Clean_Description'], all_combos['Category']])
+    unreviewed_combos = all_combos[~combo_idx.isin(mapping_series.index)]
 
     unreviewed_df = unreviewed_combos.merge(
-        merchant_stats, on=['Clean_Description', 'Category'], how='left'
+        combo_stats, on=['Clean_Description', 'Category'], how='left'
     ).sort_values('Total_Amount', ascending=False)
 
-    # Get current Budget_Category (from fallback logic in processed data)
-    current_cats = df_trans[['Clean_Description', 'Category', 'Budget_Category']].drop_duplicates(
-        subset=['Clean_Description', 'Category'], keep='first'
-    )
     unreviewed_df = unreviewed_df.merge(
         current_cats, on=['Clean_Description', 'Category'], how='left'
     )
-    unreviewed_df['Budget_Category'] = unreviewed_df['Budget_Category'].fillna('Personal')
+    unreviewed_df['Budget_Category'] = unreviewed_df['Budget_Category'].astype(object).fillna('Personal')
 
     # Metrics
     col_m1, col_m2, col_m3 = st.columns(3)
     with col_m1:
         st.metric("Unreviewed Merchants", len(unreviewed_df))
     with col_m2:
-        st.metric("Reviewed Mappings", len(reviewed_keys))
+        st.metric("Reviewed Mappings", len(mapping_series))
     with col_m3:
         st.metric("Total Unique Merchants", len(all_combos))
 
@@ -1147,7 +1461,7 @@ with tab_manage:
                 "Total_Amount": st.column_config.NumberColumn("Total Spend", format="$%.2f", disabled=True),
                 "Budget_Category": st.column_config.SelectboxColumn(
                     "Budget Category",
-                    options=sorted(BUDGET_CATEGORIES),
+                    options=BUDGET_CATEGORIES_SORTED,
                     required=True
                 ),
             },
@@ -1158,17 +1472,12 @@ with tab_manage:
         )
 
         if st.button("Save Mappings", type="primary"):
-            new_rows = []
-            for _, row in edited_df.iterrows():
-                new_rows.append({
-                    'Clean_Description': row['Clean_Description'],
-                    'Bank_Category': row['Category'],
-                    'Budget_Category': row['Budget_Category']
-                })
-            new_mappings_df = pd.DataFrame(new_rows)
+            # Column select + rename, no per-row iteration
+            new_mappings_df = edited_df[['Clean_Description', 'Category', 'Budget_Category']] \
+                .rename(columns={'Category': 'Bank_Category'})
 
             if MAPPINGS_FILE.exists():
-                existing_df = pd.read_csv(MAPPINGS_FILE)
+                existing_df = pd.read_parquet(MAPPINGS_FILE)
                 combined_df = pd.concat([existing_df, new_mappings_df], ignore_index=True)
                 combined_df = combined_df.drop_duplicates(
                     subset=['Clean_Description', 'Bank_Category'], keep='last'
@@ -1176,15 +1485,18 @@ with tab_manage:
             else:
                 combined_df = new_mappings_df
 
-            combined_df.to_csv(MAPPINGS_FILE, index=False)
+            combined_df.to_parquet(MAPPINGS_FILE, index=False)
             st.cache_data.clear()
+            # Also drop the cache_resource entries (split_by_year): its
+            # fingerprint can't see category edits
+            st.cache_resource.clear()
             st.rerun()
 
     # Reference: show existing mappings
     st.markdown("---")
     st.markdown("#### Current Mapping Table")
     if MAPPINGS_FILE.exists():
-        existing_mappings = pd.read_csv(MAPPINGS_FILE)
+        existing_mappings = pd.read_parquet(MAPPINGS_FILE)
         st.dataframe(
             existing_mappings.sort_values('Clean_Description'),
             use_container_width=True,
@@ -1196,7 +1508,8 @@ with tab_manage:
 
 # TAB 9: LOG REIMBURSEMENTS (NEW)
 # TAB 9: LOG REIMBURSEMENTS (NEW WORKFLOW)
-with tab_reimburse:
+@st.fragment
+def render_reimburse_tab():
     st.subheader("Assign Incoming Transfers to Expenses")
     st.caption("Review incoming Zelle/Venmo transfers from your checking account and assign them to offset specific budget categories. This automatically reduces your top-line spending for those categories.")
 
@@ -1259,7 +1572,7 @@ with tab_reimburse:
                     "Net_Amount": st.column_config.NumberColumn("Amount", format="$%.2f", disabled=True),
                     "Offset_Category": st.column_config.SelectboxColumn(
                         "Assign to Category",
-                        options=["Select Category..."] + sorted(BUDGET_CATEGORIES)
+                        options=["Select Category..."] + BUDGET_CATEGORIES_SORTED
                     )
                 },
                 hide_index=True,
@@ -1280,6 +1593,7 @@ with tab_reimburse:
                         
                     st.toast(f"Successfully assigned {len(to_assign)} transactions!")
                     st.cache_data.clear()
+                    st.cache_resource.clear()
                     st.rerun()
                 else:
                     st.warning("Please select a category for at least one transaction before saving.")
@@ -1310,3 +1624,14 @@ with tab_reimburse:
     else:
         st.info("No reimbursements logged yet.")
 
+
+with tab_yoy:
+    render_yoy_tab()
+with tab_recurring:
+    render_recurring_tab()
+with tab_cashflow:
+    render_cashflow_tab()
+with tab_manage:
+    render_manage_tab()
+with tab_reimburse:
+    render_reimburse_tab()
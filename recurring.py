@@ -1,21 +1,95 @@
+import numpy as np
 import pandas as pd
 
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
 from config import MONTH_NAMES
 
+# Output schema of detect_recurring_merchants / the detection core
+_RESULT_COLS = [
+    'Clean_Description', 'Budget_Category', 'Monthly_Amount',
+    'Months_Active', 'Consecutive_Months', 'Active_Range',
+    'Annual_Projected', 'Amount_Std'
+]
+
 
 def _get_longest_consecutive_run(month_numbers):
-    """Given sorted list of month numbers (1-12), return longest consecutive run."""
-    if len(month_numbers) <= 1:
-        return len(month_numbers)
-    max_run = 1
-    current_run = 1
-    for i in range(1, len(month_numbers)):
-        if month_numbers[i] == month_numbers[i - 1] + 1:
-            current_run += 1
-            max_run = max(max_run, current_run)
-        else:
-            current_run = 1
-    return max_run
+    """Given sorted month numbers (or Periods), return longest consecutive run.
+
+    Vectorized: a diff marks the breaks, a cumsum labels each run, and
+    bincount sizes them — no per-element Python loop. Scalar
+    counterpart of _longest_runs, which applies the same idea to every
+    merchant at once.
+    """
+    n = len(month_numbers)
+    if n <= 1:
+        return n
+    a = np.asarray(month_numbers)
+    if a.dtype == object:  # Period values — diff on their ordinals
+        a = pd.PeriodIndex(month_numbers).asi8
+    breaks = np.diff(a) != 1
+    groups = np.cumsum(np.concatenate(([0], breaks)))
+    return int(np.bincount(groups).max())
+
+
+def _longest_runs(monthly):
+    """Longest consecutive-month run for every merchant, in one flat pass.
+
+    ``monthly`` arrives sorted by (Clean_Description, year_month) from
+    _monthly_totals. A run breaks wherever the merchant changes or the
+    month ordinal doesn't advance by exactly one, so a single
+    diff/cumsum/bincount over the whole frame sizes every run, and
+    maximum.at reduces them per merchant — no per-merchant Python step.
+    Returns a Series of run lengths indexed by Clean_Description.
+    """
+    codes, merchants = pd.factorize(monthly['Clean_Description'])
+    ordinals = pd.PeriodIndex(monthly['year_month']).asi8
+    new_run = np.ones(len(monthly), dtype=bool)
+    new_run[1:] = (codes[1:] != codes[:-1]) | (ordinals[1:] != ordinals[:-1] + 1)
+    run_len = np.bincount(np.cumsum(new_run) - 1)
+    longest = np.zeros(len(merchants), dtype=np.int64)
+    np.maximum.at(longest, codes[new_run], run_len)
+    return pd.Series(longest, index=merchants)
+
+
+def _monthly_totals(df):
+    """Per-(merchant, month) totals and transaction counts.
+
+    This is the one aggregation that touches every transaction, so it
+    routes through polars' lazy, multi-threaded group_by when the
+    library is installed (same optional-accelerator arrangement as the
+    dashboard's CSV loading); the pandas fallback is identical. Rows
+    come back chronological within each merchant either way, which the
+    consecutive-run step relies on.
+    """
+    if pl is not None:
+        monthly = (
+            pl.from_pandas(df[['Clean_Description', 'Transaction Date', 'Net_Amount']])
+            .lazy()
+            .group_by([
+                pl.col('Clean_Description').cast(pl.String),
+                pl.col('Transaction Date').dt.truncate('1mo').alias('year_month'),
+            ])
+            .agg(
+                monthly_total=pl.col('Net_Amount').sum(),
+                tx_count=pl.col('Net_Amount').count(),
+            )
+            .sort(['Clean_Description', 'year_month'])
+            .collect()
+            .to_pandas()
+        )
+        monthly['year_month'] = monthly['year_month'].dt.to_period('M')
+        return monthly
+
+    df = df[['Clean_Description', 'Net_Amount']].assign(
+        year_month=df['Transaction Date'].dt.to_period('M'))
+    return df.groupby(['Clean_Description', 'year_month'], observed=True).agg(
+        monthly_total=('Net_Amount', 'sum'),
+        tx_count=('Net_Amount', 'count')
+    ).reset_index()
 
 
 def detect_recurring_merchants(df, amount_tolerance=2.0, min_consecutive_months=2,
@@ -30,82 +104,81 @@ def detect_recurring_merchants(df, amount_tolerance=2.0, min_consecutive_months=
     Monthly_Amount, Months_Active, Consecutive_Months, Active_Range,
     Annual_Projected, Amount_Std.
     """
-    result_cols = [
-        'Clean_Description', 'Budget_Category', 'Monthly_Amount',
-        'Months_Active', 'Consecutive_Months', 'Active_Range',
-        'Annual_Projected', 'Amount_Std'
-    ]
     if df.empty:
-        return pd.DataFrame(columns=result_cols)
+        return pd.DataFrame(columns=_RESULT_COLS)
 
-    df = df.copy()
-    
-    # FIX: Include Year so Jan 2025 and Jan 2026 are treated distinctly
-    df['year_month'] = df['Transaction Date'].dt.to_period('M')
+    # Keyed on full year-month periods so Jan 2025 and Jan 2026 stay distinct
+    monthly = _monthly_totals(df)
 
-    # Aggregate to monthly totals per merchant
-    monthly = df.groupby(['Clean_Description', 'year_month']).agg(
-        monthly_total=('Net_Amount', 'sum'),
-        tx_count=('Net_Amount', 'count')
-    ).reset_index()
+    return _detect_recurring_from_monthly(
+        monthly, df, amount_tolerance, min_consecutive_months, max_monthly_frequency)
 
-    results = []
-    for merchant, group in monthly.groupby('Clean_Description'):
-        # Sort by year_month chronologically
-        group = group.sort_values('year_month')
-        
-        # Calculate consecutive runs based on sequential periods
-        months_list = group['year_month'].tolist()
-        months_active = len(months_list)
-
-        if months_active < min_consecutive_months:
-            continue
-
-        # Check if they are consecutive (e.g., 2026-01, 2026-02)
-        consecutive = 1
-        max_run = 1
-        for i in range(1, len(months_list)):
-            if months_list[i] == months_list[i-1] + 1:
-                consecutive += 1
-            else:
-                max_run = max(max_run, consecutive)
-                consecutive = 1
-        max_run = max(max_run, consecutive)
-        
-        if max_run < min_consecutive_months:
-            continue
-
-        consecutive = _get_longest_consecutive_run(months_list)
-        if consecutive < min_consecutive_months:
-            continue
-
-        std_amount = group['monthly_total'].std()
-        if pd.isna(std_amount):
-            std_amount = 0.0
-        if std_amount > amount_tolerance:
-            continue
-
-        # Filter out frequent shopping (e.g. Costco groceries 3x/month)
-        if group['tx_count'].mean() > max_monthly_frequency:
-            continue
-
-        median_amount = group['monthly_total'].median()
-        top_category = df.loc[df['Clean_Description'] == merchant, 'Budget_Category'].mode()
-        category = top_category.iloc[0] if not top_category.empty else 'Personal'
-        active_range = ', '.join(MONTH_NAMES[m.month] for m in months_list)
-
-        results.append({
-            'Clean_Description': merchant,
-            'Budget_Category': category,
-            'Monthly_Amount': round(median_amount, 2),
-            'Months_Active': months_active,
-            'Consecutive_Months': consecutive,
-            'Active_Range': active_range,
-            'Annual_Projected': round(median_amount * 12, 2),
-            'Amount_Std': round(std_amount, 2),
-        })
 
-    return pd.DataFrame(results, columns=result_cols) if results else pd.DataFrame(columns=result_cols)
+def _detect_recurring_from_monthly(monthly, df, amount_tolerance=2.0,
+                                   min_consecutive_months=2, max_monthly_frequency=2.0):
+    """Detection core over an already-aggregated per-merchant monthly frame.
+
+    ``monthly`` has one row per (Clean_Description, year_month) with
+    monthly_total and tx_count; ``df`` supplies Budget_Category for the
+    surviving merchants. Split out so detect_subscription_changes can
+    aggregate once and run the detection on two filtered views.
+    """
+    # One grouped pass for every per-merchant statistic instead of a
+    # Python loop computing std/median/mean/len per group
+    stats = monthly.groupby('Clean_Description', observed=True).agg(
+        std_amount=('monthly_total', 'std'),
+        median_amount=('monthly_total', 'median'),
+        mean_tx=('tx_count', 'mean'),
+        months_active=('year_month', 'count'),
+    )
+    stats['std_amount'] = stats['std_amount'].fillna(0.0)
+
+    # Vectorized filters; frequent shopping (e.g. Costco 3x/month) is
+    # screened by the mean transaction count
+    stats = stats[
+        (stats['months_active'] >= min_consecutive_months)
+        & (stats['std_amount'] <= amount_tolerance)
+        & (stats['mean_tx'] <= max_monthly_frequency)
+    ]
+    if stats.empty:
+        return pd.DataFrame(columns=_RESULT_COLS)
+
+    # Consecutive-run check for all merchants at once — a flat scan of
+    # the sorted monthly frame instead of a per-merchant Python loop
+    consecutive = _longest_runs(monthly)
+    stats = stats[consecutive.reindex(stats.index) >= min_consecutive_months]
+    if stats.empty:
+        return pd.DataFrame(columns=_RESULT_COLS)
+
+    # Majority budget category per surviving merchant: count each
+    # (merchant, category) pair once and keep the winner — no per-group
+    # mode lambda. Ties break toward the alphabetically first category,
+    # matching what mode().iat[0] picked.
+    cat_counts = df[df['Clean_Description'].isin(stats.index)] \
+        .groupby(['Clean_Description', 'Budget_Category'], observed=True) \
+        .size().reset_index(name='n')
+    categories = cat_counts \
+        .sort_values(['n', 'Budget_Category'], ascending=[True, False], kind='stable') \
+        .drop_duplicates('Clean_Description', keep='last') \
+        .set_index('Clean_Description')['Budget_Category']
+
+    # Month-name ranges only for the final survivors
+    active_ranges = monthly[monthly['Clean_Description'].isin(stats.index)] \
+        .groupby('Clean_Description', observed=True)['year_month'] \
+        .agg(lambda ms: ', '.join(MONTH_NAMES[m.month] for m in ms))
+
+    return pd.DataFrame({
+        'Clean_Description': stats.index,
+        # fillna: merchants whose category is all-NaN drop out of the
+        # count groupby and fall back to 'Personal', as before
+        'Budget_Category': categories.reindex(stats.index).fillna('Personal').to_numpy(),
+        'Monthly_Amount': stats['median_amount'].round(2).to_numpy(),
+        'Months_Active': stats['months_active'].to_numpy(),
+        'Consecutive_Months': consecutive.reindex(stats.index).to_numpy(),
+        'Active_Range': active_ranges.reindex(stats.index).to_numpy(),
+        'Annual_Projected': (stats['median_amount'] * 12).round(2).to_numpy(),
+        'Amount_Std': stats['std_amount'].round(2).to_numpy(),
+    }, columns=_RESULT_COLS)
 
 
 def classify_transactions(df, recurring_merchants_df):
@@ -116,9 +189,12 @@ def classify_transactions(df, recurring_merchants_df):
         df['spending_type'] = 'Variable'
         return df
 
-    recurring_names = set(recurring_merchants_df['Clean_Description'].tolist())
+    # isin against an Index takes the hashtable fast path (no Python set
+    # round trip), and np.where labels rows in one branchless C call
+    # instead of a per-row dict dispatch
+    recurring_names = pd.Index(recurring_merchants_df['Clean_Description'])
     df['is_recurring'] = df['Clean_Description'].isin(recurring_names)
-    df['spending_type'] = df['is_recurring'].map({True: 'Fixed', False: 'Variable'})
+    df['spending_type'] = np.where(df['is_recurring'].to_numpy(), 'Fixed', 'Variable')
     return df
 
 
@@ -149,21 +225,36 @@ def detect_subscription_changes(df, amount_tolerance=2.0, min_consecutive_months
     earlier_months = set(available_months[:midpoint])
     recent_months = set(available_months[midpoint:])
 
-    earlier_recurring = detect_recurring_merchants(
-        df[df['month_num'].isin(earlier_months)], amount_tolerance, min_consecutive_months
+    # Aggregate to per-merchant monthly totals once; each half is then a
+    # filtered view of the same frame instead of a second full
+    # aggregation pipeline inside detect_recurring_merchants
+    monthly = _monthly_totals(df)
+    monthly_month_num = monthly['year_month'].dt.month
+
+    earlier_recurring = _detect_recurring_from_monthly(
+        monthly[monthly_month_num.isin(earlier_months)],
+        df[df['month_num'].isin(earlier_months)],
+        amount_tolerance, min_consecutive_months
     )
-    recent_recurring = detect_recurring_merchants(
-        df[df['month_num'].isin(recent_months)], amount_tolerance, min_consecutive_months
+    recent_recurring = _detect_recurring_from_monthly(
+        monthly[monthly_month_num.isin(recent_months)],
+        df[df['month_num'].isin(recent_months)],
+        amount_tolerance, min_consecutive_months
     )
 
-    earlier_names = set(earlier_recurring['Clean_Description']) if not earlier_recurring.empty else set()
-    recent_names = set(recent_recurring['Clean_Description']) if not recent_recurring.empty else set()
+    # Name membership via pd.Index set ops (stay in C, no Python-level
+    # hashing), and per-merchant rows via a prebuilt hash index instead
+    # of a full boolean scan for every alert
+    earlier_by_name = earlier_recurring.set_index('Clean_Description')
+    recent_by_name = recent_recurring.set_index('Clean_Description')
+    earlier_names = earlier_by_name.index
+    recent_names = recent_by_name.index
 
     alerts = []
 
     # New subscriptions
-    for merchant in recent_names - earlier_names:
-        row = recent_recurring[recent_recurring['Clean_Description'] == merchant].iloc[0]
+    for merchant in recent_names.difference(earlier_names):
+        row = recent_by_name.loc[merchant]
         alerts.append({
             'type': 'new',
             'merchant': merchant,
@@ -173,8 +264,8 @@ def detect_subscription_changes(df, amount_tolerance=2.0, min_consecutive_months
         })
 
     # Cancelled subscriptions
-    for merchant in earlier_names - recent_names:
-        row = earlier_recurring[earlier_recurring['Clean_Description'] == merchant].iloc[0]
+    for merchant in earlier_names.difference(recent_names):
+        row = earlier_by_name.loc[merchant]
         alerts.append({
             'type': 'cancelled',
             'merchant': merchant,
@@ -184,9 +275,9 @@ def detect_subscription_changes(df, amount_tolerance=2.0, min_consecutive_months
         })
 
     # Price changes
-    for merchant in earlier_names & recent_names:
-        old_row = earlier_recurring[earlier_recurring['Clean_Description'] == merchant].iloc[0]
-        new_row = recent_recurring[recent_recurring['Clean_Description'] == merchant].iloc[0]
+    for merchant in earlier_names.intersection(recent_names):
+        old_row = earlier_by_name.loc[merchant]
+        new_row = recent_by_name.loc[merchant]
         diff = new_row['Monthly_Amount'] - old_row['Monthly_Amount']
         if abs(diff) > price_change_threshold:
             change_type = 'price_increase' if diff > 0 else 'price_decrease'
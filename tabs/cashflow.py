@@ -8,6 +8,14 @@ from config import MONTH_NAMES
 from chart_helpers import apply_default_layout, make_pie_chart
 
 
+def _month_nums(df):
+    """Month numbers for grouping — the loader's precomputed Month_Num
+    when present, otherwise one dt.month pass; no frame copy either way."""
+    if 'Month_Num' in df.columns:
+        return df['Month_Num'].rename('month_num')
+    return df['Transaction Date'].dt.month.rename('month_num')
+
+
 def render(df_year, df_income_year, df_checking_year):
     st.subheader("Income & Cash Flow")
 
@@ -46,30 +54,31 @@ def render(df_year, df_income_year, df_checking_year):
     # --- Monthly Income vs Expenses Chart ---
     st.subheader("Monthly Income vs Expenses")
 
-    df_income_year = df_income_year.copy()
-    df_income_year['month_num'] = df_income_year['Transaction Date'].dt.month
-    monthly_income = df_income_year.groupby('month_num')['Net_Amount'].sum().reset_index()
-    monthly_income.columns = ['month_num', 'Income']
-
-    df_year_copy = df_year.copy()
-    df_year_copy['month_num'] = df_year_copy['Transaction Date'].dt.month
-    monthly_cc = df_year_copy.groupby('month_num')['Net_Amount'].sum().reset_index()
-    monthly_cc.columns = ['month_num', 'CC_Expenses']
-
-    monthly_ck_exp = pd.DataFrame({'month_num': range(1, 13), 'Checking_Expenses': 0})
+    # One source-tagged concat + pivot replaces three groupbys, two outer
+    # merges, and a fillna; the pivot is reused by the debit-vs-credit
+    # chart below
+    parts = [
+        pd.DataFrame({'month_num': _month_nums(df_income_year),
+                      'Net_Amount': df_income_year['Net_Amount'],
+                      'kind': 'Income'}),
+        pd.DataFrame({'month_num': _month_nums(df_year),
+                      'Net_Amount': df_year['Net_Amount'],
+                      'kind': 'CC_Expenses'}),
+    ]
     if not df_checking_year.empty:
-        df_ck_copy = df_checking_year.copy()
-        df_ck_copy['month_num'] = df_ck_copy['Transaction Date'].dt.month
-        monthly_ck_exp = df_ck_copy.groupby('month_num')['Net_Amount'].sum().reset_index()
-        monthly_ck_exp.columns = ['month_num', 'Checking_Expenses']
-
-    monthly_cf = monthly_income.merge(monthly_cc, on='month_num', how='outer') \
-                               .merge(monthly_ck_exp, on='month_num', how='outer') \
-                               .fillna(0)
+        parts.append(pd.DataFrame({'month_num': _month_nums(df_checking_year),
+                                   'Net_Amount': df_checking_year['Net_Amount'],
+                                   'kind': 'Checking_Expenses'}))
+    monthly_cf = pd.concat(parts, ignore_index=True).pivot_table(
+        index='month_num', columns='kind',
+        values='Net_Amount', aggfunc='sum', fill_value=0)
+    if 'Checking_Expenses' not in monthly_cf.columns:
+        monthly_cf['Checking_Expenses'] = 0
+    # Full 12-month axis, zero-filled like the old outer merge produced
+    monthly_cf = monthly_cf.reindex(range(1, 13), fill_value=0).reset_index()
     monthly_cf['Total_Expenses'] = monthly_cf['CC_Expenses'] + monthly_cf['Checking_Expenses']
     monthly_cf['Net_Savings'] = monthly_cf['Income'] - monthly_cf['Total_Expenses']
     monthly_cf['Month'] = monthly_cf['month_num'].map(MONTH_NAMES)
-    monthly_cf = monthly_cf.sort_values('month_num')
 
     fig_cf = go.Figure()
     fig_cf.add_trace(go.Bar(
@@ -117,22 +126,13 @@ def render(df_year, df_income_year, df_checking_year):
     st.markdown("---")
     st.subheader("Debit vs Credit Card Spending")
 
-    df_year_copy['source_type'] = 'Credit Card'
-    debit_monthly = pd.DataFrame({'month_num': range(1, 13), 'Amount': 0, 'source_type': 'Checking/Debit'})
-    if not df_checking_year.empty:
-        df_ck_m = df_checking_year.copy()
-        df_ck_m['month_num'] = df_ck_m['Transaction Date'].dt.month
-        debit_monthly = df_ck_m.groupby('month_num')['Net_Amount'].sum().reset_index()
-        debit_monthly.columns = ['month_num', 'Amount']
-        debit_monthly['source_type'] = 'Checking/Debit'
-
-    credit_monthly = df_year_copy.groupby('month_num')['Net_Amount'].sum().reset_index()
-    credit_monthly.columns = ['month_num', 'Amount']
-    credit_monthly['source_type'] = 'Credit Card'
-
-    combined_sources = pd.concat([credit_monthly, debit_monthly], ignore_index=True)
-    combined_sources['Month'] = combined_sources['month_num'].map(MONTH_NAMES)
-    combined_sources = combined_sources.sort_values('month_num')
+    # Melt the shared pivot back to long form — no fresh groupbys
+    combined_sources = monthly_cf.melt(
+        id_vars=['month_num', 'Month'],
+        value_vars=['CC_Expenses', 'Checking_Expenses'],
+        var_name='source_type', value_name='Amount')
+    combined_sources['source_type'] = combined_sources['source_type'].map(
+        {'CC_Expenses': 'Credit Card', 'Checking_Expenses': 'Checking/Debit'})
 
     fig_sources = px.bar(
         combined_sources, x='Month', y='Amount', color='source_type',
@@ -55,11 +55,13 @@ def render(df_year, df_income_year, df_checking_year, selected_year,
             x=dates, y=projection_values, mode='lines',
             name='Projection', line=dict(dash='dot', color='gray')))
 
-    actual_cum = df_year.sort_values('Transaction Date').set_index('Transaction Date')['Net_Amount'].cumsum()
-    actual_cum_resampled = actual_cum.resample('M').last()
+    # Sum per calendar month, then cumsum over at most twelve values —
+    # no per-row cumsum, no sort, no resample grouper
+    monthly_totals = df_year.groupby(
+        df_year['Transaction Date'].dt.to_period('M'))['Net_Amount'].sum().sort_index().cumsum()
 
     fig_proj.add_trace(go.Scatter(
-        x=actual_cum_resampled.index, y=actual_cum_resampled.values,
+        x=monthly_totals.index.to_timestamp(how='end').normalize(), y=monthly_totals.values,
         mode='lines+markers', name='Actual Spending',
         line=dict(color='#3B82F6', width=4)))
 
@@ -69,16 +71,13 @@ def render(df_year, df_income_year, df_checking_year, selected_year,
 
     # --- Annual Report Download ---
     st.markdown("---")
-    annual_csv = generate_annual_summary_csv(
-        df_year.to_dict('list'),
-        df_income_year.to_dict('list') if not df_income_year.empty else {},
-        df_checking_year.to_dict('list') if not df_checking_year.empty else {},
-        selected_year
-    )
     ytd_label = " (YTD)" if is_current_year else ""
     st.download_button(
         f"Download {selected_year} Annual Report{ytd_label}",
-        data=annual_csv,
+        # Deferred: generated only when the download is clicked
+        data=lambda: generate_annual_summary_csv(
+            df_year, df_income_year, df_checking_year, selected_year
+        ),
         file_name=f"{selected_year}_Annual_Summary.csv",
         mime="text/csv"
     )
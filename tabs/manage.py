@@ -10,32 +10,27 @@ def render(df_trans, mappings_dict, save_category_mappings):
     st.caption("Review and assign budget categories to merchants. "
                "Merchants not in the mappings file are flagged as unreviewed.")
 
-    # Identify unreviewed merchants across ALL data
-    all_combos = df_trans[['Clean_Description', 'Category']].drop_duplicates()
-    reviewed_keys = set(mappings_dict.keys())
-
-    unreviewed_mask = all_combos.apply(
-        lambda r: (r['Clean_Description'], r['Category']) not in reviewed_keys, axis=1
-    )
-    unreviewed_combos = all_combos[unreviewed_mask].copy()
-
-    # Enrich with transaction count and total spend
-    merchant_stats = df_trans.groupby(['Clean_Description', 'Category']).agg(
-        Transactions=('Net_Amount', 'count'),
-        Total_Amount=('Net_Amount', 'sum')
+    # One scan of df_trans yields the unique combos, their transaction
+    # count/total, and the current Budget_Category ('size' skips the
+    # per-cell NaN check that 'count' pays; 'first' replaces the separate
+    # drop_duplicates + merge)
+    merchant_stats = df_trans.groupby(['Clean_Description', 'Category'], observed=True).agg(
+        Transactions=('Net_Amount', 'size'),
+        Total_Amount=('Net_Amount', 'sum'),
+        Budget_Category=('Budget_Category', 'first'),
     ).reset_index()
+    all_combos = merchant_stats[['Clean_Description', 'Category']]
+    reviewed_keys = set(mappings_dict.keys())
 
-    unreviewed_df = unreviewed_combos.merge(
-        merchant_stats, on=['Clean_Description', 'Category'], how='left'
-    ).sort_values('Total_Amount', ascending=False)
+    # Anti-join via MultiIndex.isin: hashed C-level membership per combo
+    # instead of a Python lambda building a tuple per row
+    combo_idx = pd.MultiIndex.from_arrays(
+        [all_combos['Clean_Description'], all_combos['Category']])
+    reviewed_idx = (pd.MultiIndex.from_tuples(list(reviewed_keys))
+                    if reviewed_keys else combo_idx[:0])
 
-    # Get current Budget_Category
-    current_cats = df_trans[['Clean_Description', 'Category', 'Budget_Category']].drop_duplicates(
-        subset=['Clean_Description', 'Category'], keep='first'
-    )
-    unreviewed_df = unreviewed_df.merge(
-        current_cats, on=['Clean_Description', 'Category'], how='left'
-    )
+    unreviewed_df = merchant_stats[~combo_idx.isin(reviewed_idx)] \
+        .sort_values('Total_Amount', ascending=False).copy()
     unreviewed_df['Budget_Category'] = unreviewed_df['Budget_Category'].fillna('Personal')
 
     # Metrics
@@ -86,7 +81,7 @@ def render(df_trans, mappings_dict, save_category_mappings):
     st.markdown("---")
     st.markdown("#### Current Mapping Table")
     if MAPPINGS_FILE.exists():
-        existing_mappings = pd.read_csv(MAPPINGS_FILE)
+        existing_mappings = pd.read_parquet(MAPPINGS_FILE)
         st.dataframe(
             existing_mappings.sort_values('Clean_Description'),
             use_container_width=True,
@@ -59,12 +59,14 @@ def render(df_filtered, df_year, df_trans, df_income_year, selected_year, select
                                  margin=dict(t=0, b=0, l=10, r=10))
             st.plotly_chart(fig_fv, use_container_width=True)
 
-        # Stacked bar: Fixed vs Variable per month
-        df_fv = df_filtered.copy()
-        df_fv['month_num'] = df_fv['Transaction Date'].dt.month
-        month_fv = df_fv.groupby(['month_num', 'spending_type'])['Net_Amount'].sum().reset_index()
+        # Stacked bar: Fixed vs Variable per month. Group on the loader's
+        # precomputed Month_Num when present — no frame copy or fresh
+        # dt.month pass
+        month_nums = (df_filtered['Month_Num'] if 'Month_Num' in df_filtered.columns
+                      else df_filtered['Transaction Date'].dt.month).rename('month_num')
+        # groupby sorts its keys, so the result is already month-ordered
+        month_fv = df_filtered.groupby([month_nums, 'spending_type'])['Net_Amount'].sum().reset_index()
         month_fv['Month'] = month_fv['month_num'].map(MONTH_NAMES)
-        month_fv = month_fv.sort_values('month_num')
 
         fig_stacked = px.bar(
             month_fv, x='Month', y='Net_Amount', color='spending_type',
@@ -89,19 +91,26 @@ def render(df_filtered, df_year, df_trans, df_income_year, selected_year, select
         )
     else:
         month_abbr = selected_month[:3]
-        monthly_csv = generate_monthly_summary_csv(
-            df_year.to_dict('list'), df_trans.to_dict('list'),
-            selected_year, selected_month
-        )
+        # Deferred data callable: the report is only generated when the
+        # user actually clicks download, not on every rerun
         st.download_button(
             f"Download Monthly Report — {selected_month} {selected_year}",
-            data=monthly_csv,
+            data=lambda: generate_monthly_summary_csv(
+                df_year, df_trans, selected_year, selected_month
+            ),
             file_name=f"{selected_year}_{month_abbr}_Summary.csv",
             mime="text/csv"
         )
 
-    # --- Shareable HTML Summary ---
-    html_summary = generate_html_summary(df_filtered, df_income_year, selected_year, selected_month)
+    # --- Shareable HTML Summary (built on demand, not per rerun) ---
     with st.expander("Share This Summary"):
-        st.markdown(html_summary, unsafe_allow_html=True)
-        st.caption("Copy the table above and paste into email or Slack. The formatting will be preserved.")
+        summary_key = (selected_year, selected_month, len(df_filtered))
+        if st.button("Build summary table", key="overview_html_build"):
+            st.session_state['overview_html_summary'] = (
+                summary_key,
+                generate_html_summary(df_filtered, df_income_year, selected_year, selected_month),
+            )
+        cached = st.session_state.get('overview_html_summary')
+        if cached and cached[0] == summary_key:
+            st.markdown(cached[1], unsafe_allow_html=True)
+            st.caption("Copy the table above and paste into email or Slack. The formatting will be preserved.")
@@ -1,11 +1,36 @@
 """Recurring Expenses tab — subscription detection and fixed cost tracking."""
 
 import streamlit as st
+import pandas as pd
 import plotly.express as px
 from config import MONTH_NAMES
 from chart_helpers import apply_default_layout, make_pie_chart
 
 
+def _frame_key(df):
+    """Cheap cache key: row count plus a value-column checksum, so the
+    cache never hashes the whole frame."""
+    col = 'Net_Amount' if 'Net_Amount' in df.columns else 'Monthly_Amount'
+    return (len(df), float(df[col].sum()) if len(df) else 0.0)
+
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: _frame_key})
+def _cat_recurring(recurring_merchants):
+    """Monthly recurring cost per budget category, memoized across reruns."""
+    return recurring_merchants.groupby('Budget_Category')['Monthly_Amount'].sum().reset_index()
+
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: _frame_key})
+def _monthly_recurring(df_year):
+    """Per-month recurring spend for the trend bar, memoized across reruns."""
+    recurring_tx = df_year[df_year['is_recurring']]
+    month_nums = (recurring_tx['Month_Num'] if 'Month_Num' in recurring_tx.columns
+                  else recurring_tx['Transaction Date'].dt.month).rename('month_num')
+    out = recurring_tx.groupby(month_nums)['Net_Amount'].sum().reset_index()
+    out['Month_Name'] = out['month_num'].map(MONTH_NAMES)
+    return out
+
+
 def render(df_year, recurring_merchants, subscription_alerts):
     st.subheader("Recurring Expenses & Subscriptions")
     st.caption("Auto-detected charges that appear monthly with consistent amounts.")
@@ -19,7 +44,10 @@ def render(df_year, recurring_merchants, subscription_alerts):
     total_monthly_fixed = recurring_merchants['Monthly_Amount'].sum()
     total_annual_fixed = recurring_merchants['Annual_Projected'].sum()
     total_year_spend = df_year['Net_Amount'].sum()
-    recurring_actual = df_year[df_year['is_recurring']]['Net_Amount'].sum()
+    # Mask the values array directly — no boolean-sliced frame copy
+    # just to take one sum
+    recurring_mask = df_year['is_recurring'].to_numpy()
+    recurring_actual = df_year['Net_Amount'].to_numpy()[recurring_mask].sum()
     recurring_pct = (recurring_actual / total_year_spend * 100) if total_year_spend > 0 else 0
 
     col_r1, col_r2, col_r3 = st.columns(3)
@@ -73,7 +101,7 @@ def render(df_year, recurring_merchants, subscription_alerts):
 
     with col_rt2:
         st.markdown("#### Recurring by Category")
-        cat_recurring = recurring_merchants.groupby('Budget_Category')['Monthly_Amount'].sum().reset_index()
+        cat_recurring = _cat_recurring(recurring_merchants)
         fig_rec_pie = make_pie_chart(
             cat_recurring, 'Monthly_Amount', 'Budget_Category',
             color_discrete_sequence=px.colors.qualitative.Pastel
@@ -82,12 +110,8 @@ def render(df_year, recurring_merchants, subscription_alerts):
 
     # Monthly Recurring Spend Trend
     st.markdown("#### Monthly Recurring Spend")
-    recurring_tx = df_year[df_year['is_recurring']].copy()
-    if not recurring_tx.empty:
-        recurring_tx['month_num'] = recurring_tx['Transaction Date'].dt.month
-        monthly_recurring = recurring_tx.groupby('month_num')['Net_Amount'].sum().reset_index()
-        monthly_recurring['Month_Name'] = monthly_recurring['month_num'].map(MONTH_NAMES)
-
+    monthly_recurring = _monthly_recurring(df_year)
+    if not monthly_recurring.empty:
         fig_rec_trend = px.bar(
             monthly_recurring, x='Month_Name', y='Net_Amount',
             labels={'Net_Amount': 'Recurring Spend ($)', 'Month_Name': 'Month'},
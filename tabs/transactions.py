@@ -1,30 +1,98 @@
 """Transactions tab — search, tag metrics, editable table, save logic."""
 
 import streamlit as st
+import numpy as np
 import pandas as pd
+
+try:
+    from rapidfuzz import fuzz
+except ImportError:
+    fuzz = None
+
 from config import BUDGET_CATEGORIES
 from transaction_notes import (
     load_notes, save_notes, compute_tag_totals, get_available_tags,
 )
 
 
-def render(df_filtered, df_trans, notes_df, selected_year, selected_month, selected_category,
-           generate_filtered_transactions_csv, save_category_mappings):
-    st.subheader("Detailed Transaction Log")
+SEARCH_COLS = ('Clean_Description', 'Budget_Category', 'Note', 'Tags')
 
-    # Filter context
-    st.caption(f"Showing {len(df_filtered):,} of {len(df_trans[df_trans['Year'] == selected_year]):,} transactions")
 
-    # --- A. Global Search ---
+def _trans_key(df):
+    """Cheap cache key for the transaction log: row count plus the
+    newest transaction key (the log is sorted newest-first)."""
+    return (len(df), df['_tx_key'].iat[0] if len(df) else 0)
+
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: _trans_key})
+def _year_counts(df_trans):
+    """Transactions per year for the caption — counted once per log
+    instead of an equality scan plus slice copy every rerun."""
+    return df_trans['Year'].value_counts()
+
+
+@st.cache_resource(show_spinner=False, hash_funcs={pd.DataFrame: _trans_key})
+def _build_search_index(df_trans):
+    """Lowercased search structures, built once per transaction log.
+
+    Each entry is (values, codes): for categorical columns the values
+    are the lowered unique categories with the integer codes alongside,
+    for plain columns the lowered strings with codes of None. Rebuilt
+    only when the log changes instead of lowercasing four columns on
+    every rerun; the arrays are shared read-only (hence cache_resource,
+    no per-rerun copy)."""
+    index = {}
+    for col in SEARCH_COLS:
+        s = df_trans[col]
+        if isinstance(s.dtype, pd.CategoricalDtype):
+            index[col] = (s.cat.categories.str.lower().to_numpy(dtype=str),
+                          s.cat.codes.to_numpy())
+        else:
+            index[col] = (s.fillna('').str.lower().to_numpy(dtype=str), None)
+    return index
+
+
+def _contains_mask(entry, q):
+    """Case-insensitive substring hit mask for one indexed column.
+
+    Categorical entries are searched over their unique categories only,
+    with the hits broadcast back through the integer codes. Missing
+    values never match (same as contains(..., na=False))."""
+    values, codes = entry
+    hits = np.char.find(values, q) >= 0
+    if codes is None:
+        return hits
+    return (codes >= 0) & hits[codes]
+
+
+@st.fragment
+def _global_search(df_trans):
+    """Search box plus results panel, isolated in a fragment so typing a
+    query reruns only this subtree, not the tag metrics and the heavy
+    editable table below."""
     search_query = st.text_input("Search transactions (all years)", placeholder="Search merchant, category, note, or tag...")
     if search_query:
         q = search_query.lower()
-        search_results = df_trans[
-            df_trans['Clean_Description'].str.lower().str.contains(q, na=False)
-            | df_trans['Budget_Category'].str.lower().str.contains(q, na=False)
-            | df_trans['Note'].str.lower().str.contains(q, na=False)
-            | df_trans['Tags'].str.lower().str.contains(q, na=False)
-        ].copy()
+        # One fused mask over the cached search index instead of four
+        # chained contains pipelines: each column is scanned once and
+        # OR-ed in place
+        search_index = _build_search_index(df_trans)
+        mask = np.zeros(len(df_trans), dtype=bool)
+        for entry in search_index.values():
+            np.logical_or(mask, _contains_mask(entry, q), out=mask)
+        if fuzz is not None and len(q) >= 4:
+            # Typo-tolerant second round over merchant names when
+            # rapidfuzz is installed (optional, like polars in the
+            # loaders). Scoring runs against the unique categories
+            # only, then broadcasts through the codes — O(merchants),
+            # not O(rows).
+            values, codes = search_index['Clean_Description']
+            if codes is not None:
+                fuzzy_hits = np.fromiter(
+                    (fuzz.partial_ratio(q, v) >= 85 for v in values),
+                    dtype=bool, count=len(values))
+                np.logical_or(mask, (codes >= 0) & fuzzy_hits[codes], out=mask)
+        search_results = df_trans[mask].copy()
         search_results = search_results.sort_values('Transaction Date', ascending=False)
         result_years = search_results['Year'].nunique()
         result_total = search_results['Net_Amount'].sum()
@@ -47,6 +115,18 @@ def render(df_filtered, df_trans, notes_df, selected_year, selected_month, selec
             )
         st.markdown("---")
 
+
+def render(df_filtered, df_trans, notes_df, selected_year, selected_month, selected_category,
+           generate_filtered_transactions_csv, save_category_mappings):
+    st.subheader("Detailed Transaction Log")
+
+    # Filter context
+    year_total = _year_counts(df_trans).get(selected_year, 0)
+    st.caption(f"Showing {len(df_filtered):,} of {year_total:,} transactions")
+
+    # --- A. Global Search ---
+    _global_search(df_trans)
+
     # --- B. Tag Summary Metrics ---
     tag_totals = compute_tag_totals(df_filtered)
     if tag_totals:
@@ -61,21 +141,34 @@ def render(df_filtered, df_trans, notes_df, selected_year, selected_month, selec
     month_part = selected_month[:3] if selected_month != 'All' else 'All'
     cat_part = selected_category.replace(' ', '_').replace('/', '-') if selected_category != 'All' else 'All'
     tx_filename = f"Transactions_{selected_year}_{month_part}_{cat_part}.csv"
-    tx_csv = generate_filtered_transactions_csv(df_filtered)
     st.download_button(
         f"Download Transactions ({len(df_filtered)} rows)",
-        data=tx_csv,
+        # Deferred: the CSV is only serialized when the button is clicked
+        data=lambda: generate_filtered_transactions_csv(df_filtered),
         file_name=tx_filename,
         mime="text/csv"
     )
 
-    # --- C. Editable Transaction Table ---
+    # --- C. Editable Transaction Table (paginated) ---
     editor_df = df_filtered[['_tx_key', 'Transaction Date', 'Clean_Description', 'Category', 'Budget_Category', 'Net_Amount', 'Note', 'Tags']].copy()
     editor_df = editor_df.sort_values('Transaction Date', ascending=False).reset_index(drop=True)
-    original_categories = editor_df[['_tx_key', 'Budget_Category']].copy()
+
+    # Only one page is serialized to the browser per rerun, bounding the
+    # editor's render cost regardless of how many rows match the filter
+    page_size = 200
+    total_pages = max(1, -(-len(editor_df) // page_size))
+    page = 1
+    if total_pages > 1:
+        page = st.number_input(
+            f"Page ({page_size} rows each, {total_pages} pages)",
+            min_value=1, max_value=total_pages, value=1, step=1)
+        st.caption("Save changes before switching pages — edits apply to the visible page.")
+    start = (page - 1) * page_size
+    page_df = editor_df.iloc[start:start + page_size]
+    original_categories = page_df[['_tx_key', 'Budget_Category']].copy()
 
     edited_df = st.data_editor(
-        editor_df,
+        page_df,
         column_config={
             "Transaction Date": st.column_config.DateColumn("Date", format="YYYY-MM-DD", disabled=True),
             "Clean_Description": st.column_config.TextColumn("Merchant", disabled=True),
@@ -93,45 +186,39 @@ def render(df_filtered, df_trans, notes_df, selected_year, selected_month, selec
         height=600,
         hide_index=True,
         num_rows="fixed",
-        key="transaction_editor"
+        # Keyed per page so a stale edit overlay never lands on the
+        # wrong rows after a page switch
+        key=f"transaction_editor_p{page}"
     )
 
     # --- D. Save Button ---
     if st.button("Save Changes", type="primary"):
         changes_made = False
 
-        # 1. Category changes
-        merged_cats = original_categories.merge(
-            edited_df[['_tx_key', 'Budget_Category']],
-            on='_tx_key', suffixes=('_old', '_new')
-        )
-        changed = merged_cats[merged_cats['Budget_Category_old'] != merged_cats['Budget_Category_new']]
+        # 1. Category changes — st.data_editor preserves row order, so a
+        # positional array compare finds the edits without a hash join
+        old_cats = original_categories['Budget_Category'].to_numpy()
+        new_cats = edited_df['Budget_Category'].to_numpy()
+        changed = edited_df.loc[old_cats != new_cats,
+                                ['Clean_Description', 'Category', 'Budget_Category']]
         if not changed.empty:
-            changed_with_info = changed.merge(
-                editor_df[['_tx_key', 'Clean_Description', 'Category']].drop_duplicates(subset=['_tx_key']),
-                on='_tx_key', how='left'
-            )
-            new_mapping_rows = []
-            for _, row in changed_with_info.iterrows():
-                new_mapping_rows.append({
-                    'Clean_Description': row['Clean_Description'],
-                    'Bank_Category': row['Category'],
-                    'Budget_Category': row['Budget_Category_new']
-                })
-            save_category_mappings(pd.DataFrame(new_mapping_rows))
+            save_category_mappings(changed.rename(columns={'Category': 'Bank_Category'}))
             changes_made = True
 
-        # 2. Notes/Tags
-        full_notes = load_notes()
-        editor_keys = set(edited_df['_tx_key'].tolist())
-        other_notes = full_notes[~full_notes['_tx_key'].isin(editor_keys)]
-        editor_notes = edited_df[['_tx_key', 'Note', 'Tags']].copy()
-        combined_notes = pd.concat([other_notes, editor_notes], ignore_index=True)
-        save_notes(combined_notes)
+        # 2. Notes/Tags — index-keyed upsert: editor rows override their
+        # keys and everything else carries over, with no full-frame
+        # isin filter + concat per save
+        notes = load_notes().set_index('_tx_key')
+        edited_notes = edited_df.set_index('_tx_key')[['Note', 'Tags']].fillna('')
+        save_notes(edited_notes.combine_first(notes).reset_index())
         changes_made = True
 
         if changes_made:
             st.cache_data.clear()
+            # The search index sits in cache_resource under a key that
+            # doesn't change when a note/tag/category is edited — drop
+            # it so search sees the new values
+            st.cache_resource.clear()
             st.rerun()
 
     # Available tags reference
@@ -2,8 +2,10 @@
 
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
 import plotly.express as px
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+from config import MONTH_NAMES
 from chart_helpers import apply_default_layout
 
 
@@ -27,63 +29,76 @@ def render(df_trans):
         st.warning("Please select at least 2 years to compare.")
         return
 
-    df_compare = df_trans[df_trans['Year'].isin(compare_years)].copy()
-    df_compare['Month_Num'] = df_compare['Transaction Date'].dt.month
-    df_compare['Month_Name'] = df_compare['Transaction Date'].dt.strftime('%b')
-    compare_years_str = [str(y) for y in sorted(compare_years)]
-    df_compare['Year'] = df_compare['Year'].astype(str)
-
-    # Chart 1: Monthly Spending Overlay
-    st.markdown("#### Monthly Spending by Year")
+    # Carry only the columns this tab touches — the wide note/tag/
+    # merchant string columns never get copied
+    cols_needed = ['Year', 'Transaction Date', 'Budget_Category', 'Net_Amount']
+    cols_needed += [c for c in ('Month_Num', 'DayOfYear') if c in df_trans.columns]
+    df_compare = df_trans.loc[df_trans['Year'].isin(compare_years), cols_needed].copy()
+    # Loader-precomputed month/day columns; fall back to the datetime
+    # accessors only when fed a frame that lacks them
+    if 'Month_Num' not in df_compare.columns:
+        df_compare['Month_Num'] = df_compare['Transaction Date'].dt.month
+    if 'DayOfYear' not in df_compare.columns:
+        df_compare['DayOfYear'] = df_compare['Transaction Date'].dt.dayofyear
+    # Mapping the month number avoids a per-row strftime string build
+    df_compare['Month_Name'] = df_compare['Month_Num'].map(MONTH_NAMES)
+    # Year stays numeric — px treats a color column as discrete either
+    # way, so no astype(str) pass over the frame
+    compare_years_sorted = sorted(compare_years)
+
+    # Charts: monthly overlay, category bars, cumulative curves
     monthly = df_compare.groupby(['Year', 'Month_Num', 'Month_Name'])['Net_Amount'].sum().reset_index()
     monthly = monthly.sort_values('Month_Num')
-
-    fig_monthly = px.line(
-        monthly, x='Month_Name', y='Net_Amount', color='Year',
-        markers=True, labels={'Net_Amount': 'Total Spend ($)', 'Month_Name': 'Month'},
-        color_discrete_sequence=px.colors.qualitative.Set2
-    )
-    apply_default_layout(fig_monthly, hovermode="x unified")
-    st.plotly_chart(fig_monthly, use_container_width=True)
-
-    # Chart 2: Category Comparison
-    st.markdown("#### Spending by Category per Year")
     cat_compare = df_compare.groupby(['Year', 'Budget_Category'])['Net_Amount'].sum().reset_index()
-
-    fig_cat = px.bar(
-        cat_compare, x='Budget_Category', y='Net_Amount', color='Year',
-        barmode='group', labels={'Net_Amount': 'Total ($)', 'Budget_Category': 'Category'},
-        color_discrete_sequence=px.colors.qualitative.Set2
-    )
-    apply_default_layout(fig_cat, xaxis_tickangle=-45)
-    st.plotly_chart(fig_cat, use_container_width=True)
-
-    # Chart 3: Cumulative Spending Curves
-    st.markdown("#### Cumulative Spending Through the Year")
-    fig_cum = go.Figure()
-    for year_str in compare_years_str:
-        yr_data = df_compare[df_compare['Year'] == year_str].sort_values('Transaction Date').copy()
-        yr_data['DayOfYear'] = yr_data['Transaction Date'].dt.dayofyear
-        yr_data['Cumulative'] = yr_data['Net_Amount'].cumsum()
-        fig_cum.add_trace(go.Scatter(
-            x=yr_data['DayOfYear'], y=yr_data['Cumulative'],
-            mode='lines', name=year_str, line=dict(width=3)
-        ))
-    apply_default_layout(fig_cum, xaxis_title="Day of Year", yaxis_title="Cumulative Spend ($)",
-                         hovermode="x unified")
-    st.plotly_chart(fig_cum, use_container_width=True)
+    # One sort + per-year grouped cumsum instead of a filter/sort/cumsum
+    # pass per selected year
+    df_cum = df_compare.sort_values('Transaction Date')
+    df_cum['Cumulative'] = df_cum.groupby('Year', observed=True)['Net_Amount'].cumsum()
+
+    # One stacked subplot figure: a single serialized payload and one
+    # browser mount instead of three separate st.plotly_chart calls
+    fig = make_subplots(
+        rows=3, cols=1, vertical_spacing=0.08,
+        subplot_titles=("Monthly Spending by Year",
+                        "Spending by Category per Year",
+                        "Cumulative Spending Through the Year"))
+    colors = px.colors.qualitative.Set2
+    for i, year in enumerate(compare_years_sorted):
+        color = colors[i % len(colors)]
+        name = str(year)
+        m = monthly[monthly['Year'] == year]
+        fig.add_trace(go.Scatter(
+            x=m['Month_Name'], y=m['Net_Amount'], mode='lines+markers',
+            name=name, legendgroup=name, line=dict(color=color)),
+            row=1, col=1)
+        c = cat_compare[cat_compare['Year'] == year]
+        fig.add_trace(go.Bar(
+            x=c['Budget_Category'], y=c['Net_Amount'],
+            name=name, legendgroup=name, showlegend=False, marker_color=color),
+            row=2, col=1)
+        yd = df_cum[df_cum['Year'] == year]
+        fig.add_trace(go.Scatter(
+            x=yd['DayOfYear'], y=yd['Cumulative'], mode='lines',
+            name=name, legendgroup=name, showlegend=False,
+            line=dict(color=color, width=3)),
+            row=3, col=1)
+    apply_default_layout(fig, height=1000, barmode='group', hovermode="x unified")
+    fig.update_xaxes(tickangle=-45, row=2, col=1)
+    fig.update_xaxes(title_text="Day of Year", row=3, col=1)
+    fig.update_yaxes(title_text="Total Spend ($)", row=1, col=1)
+    fig.update_yaxes(title_text="Total ($)", row=2, col=1)
+    fig.update_yaxes(title_text="Cumulative Spend ($)", row=3, col=1)
+    st.plotly_chart(fig, use_container_width=True)
 
     # Table: YoY Change by Category
     st.markdown("#### Year-over-Year Change by Category")
-    if len(compare_years_str) == 2:
-        yr_old, yr_new = compare_years_str
-        old_cats = df_compare[df_compare['Year'] == yr_old].groupby('Budget_Category')['Net_Amount'].sum()
-        new_cats = df_compare[df_compare['Year'] == yr_new].groupby('Budget_Category')['Net_Amount'].sum()
-
-        change_df = pd.DataFrame({
-            f'{yr_old} Total': old_cats,
-            f'{yr_new} Total': new_cats
-        }).fillna(0)
+    if len(compare_years_sorted) == 2:
+        yr_old, yr_new = compare_years_sorted
+        # One grouped pass + unstack instead of a filter-and-groupby per
+        # year; the year columns come out ascending, zero-filled
+        change_df = df_compare.groupby(['Budget_Category', 'Year'], observed=True)['Net_Amount'] \
+            .sum().unstack('Year', fill_value=0)
+        change_df.columns = [f'{c} Total' for c in change_df.columns]
         change_df['Change ($)'] = change_df[f'{yr_new} Total'] - change_df[f'{yr_old} Total']
         change_df['Change (%)'] = (
             (change_df['Change ($)'] / change_df[f'{yr_old} Total'].replace(0, float('nan'))) * 100
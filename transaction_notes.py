@@ -1,15 +1,56 @@
+import re
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+except ImportError:  # pragma: no cover - pyarrow ships with pandas here
+    pa = None
+
 import config
 
+# Splitting on the compiled pattern eats the surrounding whitespace in
+# one scan, so exploded tags never need a second per-element strip
+_TAG_SPLIT = re.compile(r"\s*,\s*")
+
+# date::merchant::amount::occurrence — amount and occurrence are the
+# last two segments
+_KEY_PARTS = re.compile(r"^(.*)::(-?\d+(?:\.\d+)?)::(\d+)$")
+
+
+def _format_cents(cents):
+    """Render an int64 cents array as canonical 2-decimal strings.
+
+    Integer ``astype(str)`` is a tight C path, and rounding to cents
+    first keeps float32 artifacts (``40.099998...``) out of the keys.
+    """
+    mag = np.abs(cents)
+    body = np.char.add(np.char.add((mag // 100).astype(str), "."),
+                       np.char.zfill((mag % 100).astype(str), 2))
+    return np.char.add(np.where(cents < 0, "-", ""), body)
+
+
+@lru_cache(maxsize=8192)
+def _fmt_date(date):
+    """Memoized date→string formatting for the scalar key path.
+
+    Repeated dates skip the Timestamp construction and strftime call;
+    the vectorized ``add_tx_keys`` does not go through here.
+    """
+    return date if isinstance(date, str) else pd.Timestamp(date).strftime("%Y-%m-%d")
+
 
 def generate_tx_key(date, merchant, amount):
     """Build a unique-ish key from date, merchant, and amount.
 
-    Format: ``2024-01-15::Starbucks::5.25``
+    Format: ``2024-01-15::Starbucks::5.25`` — the amount is always the
+    canonical 2-decimal form.
     """
-    date_str = pd.Timestamp(date).strftime("%Y-%m-%d") if not isinstance(date, str) else date
-    return f"{date_str}::{merchant}::{amount}"
+    return f"{_fmt_date(date)}::{merchant}::{float(amount):.2f}"
 
 
 def add_tx_keys(df):
@@ -18,34 +59,85 @@ def add_tx_keys(df):
     Keys include an occurrence index to handle duplicate transactions
     (e.g., two $5.25 Starbucks charges on the same day) — keys become
     ``2024-01-15::Starbucks::5.25::0``, ``...::1``, etc.
+
+    Built vectorized: one strftime pass and C-level string concatenation
+    instead of a Python ``generate_tx_key`` call per row (the scalar
+    helper remains for building a single key).
     """
-    df = df.copy()
-    base_key = df.apply(
-        lambda r: generate_tx_key(r["Transaction Date"], r["Clean_Description"], r["Net_Amount"]),
-        axis=1,
-    )
+    # The loader hands over a datetime64 column already — only reparse
+    # (with the duplicate-string cache on) when fed raw strings
+    col = df["Transaction Date"]
+    if not pd.api.types.is_datetime64_any_dtype(col):
+        col = pd.to_datetime(col, cache=True)
+    dates = col.dt.strftime("%Y-%m-%d")
+    cents = np.round(df["Net_Amount"].to_numpy("float64") * 100).astype(np.int64)
+    base_key = dates.str.cat(
+        [df["Clean_Description"].astype(str), _format_cents(cents)], sep="::")
     occurrence = base_key.groupby(base_key).cumcount()
-    df["_tx_key"] = base_key + "::" + occurrence.astype(str)
-    return df
+    tx_key = base_key.str.cat(occurrence.astype(str), sep="::")
+    # assign() shares the existing column blocks, so only the two key
+    # columns are materialized — no full-frame copy. The 64-bit
+    # companion key lets joins and maps probe an 8-byte integer instead
+    # of re-hashing a variable-length string; the readable _tx_key
+    # stays the persisted form.
+    return df.assign(
+        _tx_key=tx_key,
+        _tx_key_h=pd.util.hash_pandas_object(tx_key, index=False),
+    )
+
 
+def _normalize_notes(df):
+    """Fill in missing note columns and migrate legacy keys in place.
 
-def load_notes():
+    Old 3-part keys (``date::merchant::amount``) become 4-part
+    (``...::0``) — counted and rebuilt over the flat numpy buffer, no
+    masked Series concatenation (np.where sidesteps fixed-width
+    truncation on in-place element assignment).
+    """
+    for col in ("_tx_key", "Note", "Tags"):
+        if col not in df.columns:
+            df[col] = ""
+    arr = df["_tx_key"].to_numpy(dtype=str)
+    mask = np.char.count(arr, "::") == 2
+    if mask.any():
+        df["_tx_key"] = np.where(mask, np.char.add(arr, "::0"), arr)
+    # Canonicalize the amount segment to 2 decimals so keys written
+    # before the cents format ("150.0", float32 repr drift) still match
+    # freshly generated ones
+    parts = df["_tx_key"].str.extract(_KEY_PARTS)
+    amt = pd.to_numeric(parts[1], errors="coerce")
+    fix = amt.notna()
+    if fix.any():
+        cents = np.round(amt[fix].to_numpy("float64") * 100).astype(np.int64)
+        df.loc[fix, "_tx_key"] = (
+            parts.loc[fix, 0] + "::" + _format_cents(cents) + "::" + parts.loc[fix, 2])
+    return df[["_tx_key", "Note", "Tags"]]
+
+
+def load_notes(key_filter=None):
     """Read ``transaction_notes.csv`` and return a DataFrame with ``[_tx_key, Note, Tags]``.
 
-    Migrates old 3-part keys (``date::merchant::amount``) to 4-part format
-    (``date::merchant::amount::0``) for backward compatibility.
+    With ``key_filter`` (a set of transaction keys), the file is
+    streamed in chunks and only matching rows are kept, so memory stays
+    bounded by the chunk size rather than the file.
     """
     if not config.NOTES_FILE.exists():
         return pd.DataFrame(columns=["_tx_key", "Note", "Tags"])
     try:
-        df = pd.read_csv(config.NOTES_FILE, dtype=str).fillna("")
-        for col in ("_tx_key", "Note", "Tags"):
-            if col not in df.columns:
-                df[col] = ""
-        # Migrate old 3-part keys → 4-part by appending ::0
-        mask = df["_tx_key"].str.count("::") == 2
-        df.loc[mask, "_tx_key"] = df.loc[mask, "_tx_key"] + "::0"
-        return df[["_tx_key", "Note", "Tags"]]
+        # Parse only the three note columns and skip NA detection — with
+        # na_filter off empty cells come back as "", so no fillna pass
+        read_kwargs = dict(dtype=str,
+                           usecols=lambda c: c in {"_tx_key", "Note", "Tags"},
+                           keep_default_na=False, na_filter=False)
+        if key_filter is None:
+            return _normalize_notes(pd.read_csv(config.NOTES_FILE, **read_kwargs))
+        kept = []
+        for chunk in pd.read_csv(config.NOTES_FILE, chunksize=50_000, **read_kwargs):
+            chunk = _normalize_notes(chunk)
+            kept.append(chunk[chunk["_tx_key"].isin(key_filter)])
+        if kept:
+            return pd.concat(kept, ignore_index=True)
+        return pd.DataFrame(columns=["_tx_key", "Note", "Tags"])
     except (pd.errors.EmptyDataError, Exception):
         return pd.DataFrame(columns=["_tx_key", "Note", "Tags"])
 
@@ -55,19 +147,28 @@ def save_notes(notes_df):
 
     Uses atomic write (temp file + rename) to prevent corruption on crash.
     """
-    df = notes_df.copy()
-    df["Note"] = df["Note"].fillna("").astype(str).str.strip()
-    df["Tags"] = df["Tags"].fillna("").astype(str).str.strip()
-
-    # Drop rows with no content
-    df = df[~((df["Note"] == "") & (df["Tags"] == ""))]
+    # Cleaned Series are fresh allocations already, so no up-front
+    # full-frame copy — the output frame is built once, rows with
+    # content only
+    note = notes_df["Note"].fillna("").astype(str).str.strip()
+    tags = notes_df["Tags"].fillna("").astype(str).str.strip()
+    mask = (note != "") | (tags != "")
+    df = pd.DataFrame({
+        "_tx_key": notes_df.loc[mask, "_tx_key"].to_numpy(),
+        "Note": note[mask].to_numpy(),
+        "Tags": tags[mask].to_numpy(),
+    })
 
     # Deduplicate — keep last entry per key
     df = df.drop_duplicates(subset=["_tx_key"], keep="last")
 
-    # Atomic write: write to temp file, then rename
+    # Atomic write: write to temp file, then rename. Arrow's C++ CSV
+    # writer when available, pandas' otherwise.
     tmp_file = config.NOTES_FILE.with_suffix(".csv.tmp")
-    df[["_tx_key", "Note", "Tags"]].to_csv(tmp_file, index=False)
+    if pa is not None:
+        pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), str(tmp_file))
+    else:
+        df.to_csv(tmp_file, index=False)
     tmp_file.replace(config.NOTES_FILE)
 
 
@@ -81,28 +182,43 @@ def merge_notes(df, notes_df):
             df["Tags"] = ""
         return df
 
+    # Stale-notes short-circuit (e.g. a re-ingest shifted every
+    # occurrence index): skip building the lookup when nothing matches
+    if not notes_df["_tx_key"].isin(df["_tx_key"]).any():
+        df = df.copy()
+        df["Note"] = ""
+        df["Tags"] = ""
+        return df
+
     # Avoid column collisions on repeated merges
     for col in ("Note", "Tags"):
         if col in df.columns:
             df = df.drop(columns=[col])
 
-    merged = df.merge(notes_df[["_tx_key", "Note", "Tags"]], on="_tx_key", how="left")
-    merged["Note"] = merged["Note"].fillna("")
-    merged["Tags"] = merged["Tags"].fillna("")
-    return merged
+    # Series.map against a keyed index instead of a hash join: one
+    # lookup pass per column, no row reordering or full-frame copy.
+    # The lookups run over the int64 companion keys when present, so
+    # probing compares 8-byte integers rather than strings.
+    df = df.copy()
+    if "_tx_key_h" in df.columns:
+        keys = df["_tx_key_h"]
+        idx = notes_df.set_index(
+            pd.util.hash_pandas_object(notes_df["_tx_key"], index=False))
+    else:
+        keys = df["_tx_key"]
+        idx = notes_df.set_index("_tx_key")
+    df["Note"] = keys.map(idx["Note"]).fillna("")
+    df["Tags"] = keys.map(idx["Tags"]).fillna("")
+    return df
 
 
 def get_all_tags(notes_df):
     """Extract all unique tags that appear in the data."""
     if notes_df.empty or "Tags" not in notes_df.columns:
         return set()
-    all_tags = set()
-    for tag_str in notes_df["Tags"].dropna():
-        for tag in str(tag_str).split(","):
-            tag = tag.strip()
-            if tag:
-                all_tags.add(tag)
-    return all_tags
+    # Split/explode in one pandas chain — no per-row Python loop
+    s = notes_df["Tags"].dropna().astype(str).str.strip().str.split(_TAG_SPLIT).explode()
+    return set(s[s.ne("")].unique())
 
 
 def get_available_tags(notes_df):
@@ -113,19 +229,17 @@ def get_available_tags(notes_df):
 
 
 def filter_by_tags(df, selected_tags):
-    """Filter DataFrame to rows that have ANY of the selected tags."""
+    """Filter DataFrame to rows that have ANY of the selected tags.
+
+    One vectorized regex scan (comma-anchored alternation) instead of a
+    per-row Python split-into-set closure.
+    """
     if not selected_tags or "Tags" not in df.columns:
         return df
 
-    selected = set(selected_tags)
-
-    def has_tag(tag_str):
-        if not isinstance(tag_str, str) or not tag_str.strip():
-            return False
-        row_tags = {t.strip() for t in tag_str.split(",")}
-        return bool(row_tags & selected)
-
-    return df[df["Tags"].apply(has_tag)].copy()
+    pat = r"(?:^|,)\s*(?:" + "|".join(re.escape(t) for t in selected_tags) + r")\s*(?:,|$)"
+    mask = df["Tags"].fillna("").str.contains(pat, regex=True, na=False)
+    return df[mask].copy()
 
 
 def compute_tag_totals(df):
@@ -133,13 +247,31 @@ def compute_tag_totals(df):
     if "Tags" not in df.columns or "Net_Amount" not in df.columns:
         return {}
 
+    if pa is not None:
+        # Split/flatten/group entirely inside Arrow's C++ kernels — no
+        # object-array round trip through explode
+        tags = pa.array(df["Tags"].fillna("").astype(str))
+        amts = pa.array(df["Net_Amount"].astype("float64"))
+        split = pc.split_pattern_regex(tags, pattern=_TAG_SPLIT.pattern)
+        flat = pc.utf8_trim_whitespace(pc.list_flatten(split))
+        rep_amts = amts.take(pc.list_parent_indices(split))
+        table = pa.table({"tag": flat, "amt": rep_amts}) \
+            .filter(pc.not_equal(flat, ""))
+        if table.num_rows == 0:
+            return {}
+        result = table.group_by("tag").aggregate([("amt", "sum")])
+        return dict(zip(result["tag"].to_pylist(), result["amt_sum"].to_pylist()))
+
     tagged = df[df["Tags"].fillna("").str.strip().ne("")][["Tags", "Net_Amount"]].copy()
     if tagged.empty:
         return {}
 
-    # Vectorized: split tags, explode to one row per tag, then groupby sum
-    tagged["Tags"] = tagged["Tags"].str.split(",")
+    # Vectorized: split tags and explode to one row per tag, then sum
+    # per tag code with a single bincount pass over flat numpy buffers
+    tagged["Tags"] = tagged["Tags"].str.strip().str.split(_TAG_SPLIT)
     exploded = tagged.explode("Tags")
-    exploded["Tags"] = exploded["Tags"].str.strip()
     exploded = exploded[exploded["Tags"].ne("")]
-    return exploded.groupby("Tags")["Net_Amount"].sum().to_dict()
+    codes, uniques = pd.factorize(exploded["Tags"])
+    totals = np.bincount(codes, weights=exploded["Net_Amount"].to_numpy("float64"),
+                         minlength=len(uniques))
+    return dict(zip(uniques, totals))